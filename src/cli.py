@@ -44,9 +44,9 @@ def _run_async(coro):
 
 
 def _get_workflow_engine():
-    """Lazy-import and return a WorkflowEngine instance."""
+    """Lazy-import and return the shared WorkflowEngine instance."""
     from src.workflows import WorkflowEngine
-    return WorkflowEngine()
+    return WorkflowEngine.instance()
 
 
 def _print_results(results: dict, title: str = "Results") -> None:
@@ -109,10 +109,12 @@ def audit(
         engine = _get_workflow_engine()
 
         async def _run():
+            from src.utils.validators import normalize_url
+
             results = {"domain": domain, "steps": {}}
+            url = normalize_url(domain)
             try:
                 auditor = engine._get_technical_auditor()
-                url = domain if domain.startswith("http") else "https://" + domain
                 audit_data = await auditor.run_full_audit(url)
                 score_data = auditor.score_audit(audit_data)
                 results["steps"]["technical_audit"] = {"status": "success", "data": audit_data, "score": score_data}
@@ -120,7 +122,6 @@ def audit(
                 results["steps"]["technical_audit"] = {"status": "error", "error": str(exc)}
             try:
                 optimizer = engine._get_onpage_optimizer()
-                url = domain if domain.startswith("http") else "https://" + domain
                 onpage_data = await optimizer.analyze_page(url)
                 results["steps"]["onpage_analysis"] = {"status": "success", "data": onpage_data}
             except Exception as exc:
@@ -588,7 +589,7 @@ def status(
     # Workflow engine
     try:
         from src.workflows import WorkflowEngine
-        engine_instance = WorkflowEngine()
+        engine_instance = WorkflowEngine.instance()
         pipeline_status = engine_instance.get_pipeline_status()
         running = sum(1 for v in pipeline_status.values() if v.get("status") == "running")
         table.add_row("Workflow Engine", "[green]\u2714 OK[/green]", str(running) + " pipelines running")
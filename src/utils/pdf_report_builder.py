@@ -3,12 +3,26 @@
 
 Builder-pattern class that constructs professional, narrative-style
 HTML reports with embedded matplotlib charts and converts them to PDF
-via xhtml2pdf (pure Python) with WeasyPrint fallback.
+via headless Chromium (Playwright), falling back to xhtml2pdf (pure
+Python) and then WeasyPrint.
 """
 from __future__ import annotations
 
 import os
+import collections
 import datetime
+import functools
+import hashlib
+import io
+import math
+import pathlib
+import pickle
+import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any, Dict, List, Optional, Tuple
 
 
@@ -34,61 +48,132 @@ _COLORS = {
     'border': '#e2e8f0',
 }
 
+# HTML is spooled in memory up to this size before spilling to disk
+_HTML_SPOOL_SIZE = 8 * 1024 * 1024
+
+# PDF backends in resolution order. Chromium (via Playwright) renders with
+# Skia and is far faster than the pure-Python engines on large documents.
+_PDF_BACKENDS = ('chromium', 'xhtml2pdf', 'weasyprint')
+
+# xhtml2pdf lays out tables in quadratic time; past this many table rows
+# WeasyPrint is tried before it.
+_LARGE_TABLE_ROWS = 200
+_LARGE_TABLE_BACKENDS = ('chromium', 'weasyprint', 'xhtml2pdf')
+
+# On-disk cache of finished PDFs keyed by builder-state hash (opt-in),
+# under the project's data/ directory whatever the working directory
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+_PDF_CACHE_DIR = os.path.join(_PROJECT_ROOT, 'data', 'cache', 'pdf')
+_PDF_CACHE_SIZE = 64
+
+# Worker pool for build_pdf_async, created on first use
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+# Rendered chart HTML keyed by spec content hash, shared across builders
+_CHART_CACHE_SIZE = 128
+_chart_cache = collections.OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+# Chart kinds emitted as hand-written SVG (no matplotlib involved)
+_SVG_CHARTS = frozenset({'gauge', 'radar'})
+
 _CHART_PALETTE = [
     '#2563eb', '#16a34a', '#ca8a04', '#dc2626', '#7c3aed',
     '#0891b2', '#db2777', '#ea580c', '#4f46e5', '#059669',
 ]
 
+# Palette cycled out to k colours, for every k a chart is likely to need
+_PALETTE_PREFIX = tuple(
+    tuple(_CHART_PALETTE[i % len(_CHART_PALETTE)] for i in range(k))
+    for k in range(25)
+)
+
+# Score buckets indexed by (score >= 60) + (score >= 80): red, yellow, green
+_SCORE_COLORS = (_COLORS['red'], _COLORS['yellow'], _COLORS['green'])
+_SCORE_BGS = (_COLORS['red_bg'], _COLORS['yellow_bg'], _COLORS['green_bg'])
+
+_SEV_RED = frozenset({'critical', 'high', 'p1', 'error'})
+_SEV_YELLOW = frozenset({'medium', 'warning', 'p2'})
+_SEV_BLUE = frozenset({'low', 'info', 'p3'})
+
 
 def _score_color(score):
     """Return color hex based on score threshold."""
-    if score >= 80:
-        return _COLORS['green']
-    elif score >= 60:
-        return _COLORS['yellow']
-    return _COLORS['red']
+    return _SCORE_COLORS[(score >= 60) + (score >= 80)]
 
 
 def _score_bg(score):
     """Return background color based on score threshold."""
-    if score >= 80:
-        return _COLORS['green_bg']
-    elif score >= 60:
-        return _COLORS['yellow_bg']
-    return _COLORS['red_bg']
+    return _SCORE_BGS[(score >= 60) + (score >= 80)]
 
 
+@functools.lru_cache(maxsize=64)
 def _severity_color(severity):
-    """Return color for severity level."""
+    """Return color for severity level (cached; severities repeat)."""
     sev = str(severity).lower()
-    if sev in ('critical', 'high', 'p1', 'error'):
+    if sev in _SEV_RED:
         return _COLORS['red']
-    elif sev in ('medium', 'warning', 'p2'):
+    elif sev in _SEV_YELLOW:
         return _COLORS['yellow']
-    elif sev in ('low', 'info', 'p3'):
+    elif sev in _SEV_BLUE:
         return _COLORS['blue']
     return _COLORS['gray']
 
 
+# Values whose str() can never contain HTML special characters
+_SAFE_TYPES = (int, float, bool)
+
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+})
+
+
+@functools.lru_cache(maxsize=32)
+def _radar_unit_vectors(n):
+    """Return (cos, sin) pairs for n radar axes, computed once per n.
+
+    Same orientation as a matplotlib polar axis: first axis due east,
+    counter-clockwise. Spokes, data polygon and labels are all plain
+    cartesian ``centre + r * unit`` products of these vectors.
+    """
+    step = 2 * math.pi / n
+    return tuple((math.cos(i * step), math.sin(i * step)) for i in range(n))
+
+
 def _escape_html(text):
-    """Escape HTML special characters."""
+    """Escape HTML special characters in a single translate pass."""
     if text is None:
         return 'N/A'
-    return (
-        str(text)
-        .replace('&', '&amp;')
-        .replace('<', '&lt;')
-        .replace('>', '&gt;')
-        .replace('"', '&quot;')
-    )
+    return str(text).translate(_HTML_ESCAPE)
+
+
+def _safe_num(value):
+    """Format a value for HTML, skipping the escape pass for numbers."""
+    if isinstance(value, _SAFE_TYPES):
+        return str(value)
+    return _escape_html(value)
 
 
-def _build_css(footer_text):
-    """Build xhtml2pdf-compatible CSS stylesheet."""
-    c = _COLORS
-    # xhtml2pdf only supports basic CSS 2.1
-    # No flexbox, no border-radius, no advanced selectors
-    css = """
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _safe_date(value):
+    """Format a date for HTML; plain YYYY-MM-DD strings need no escaping."""
+    if isinstance(value, str) and _ISO_DATE_RE.fullmatch(value):
+        return value
+    return _escape_html(value)
+
+
+# Stylesheet is identical for every report, so it is assembled once at
+# import time. xhtml2pdf only supports basic CSS 2.1: no flexbox, no
+# border-radius, no advanced selectors.
+_CSS = """
 @page {
     size: A4;
     margin: 2cm 1.5cm 2cm 1.5cm;
@@ -97,7 +182,7 @@ body {
     font-family: Helvetica, Arial, sans-serif;
     font-size: 11pt;
     line-height: 1.6;
-    color: """ + c['text'] + """;
+    color: """ + _COLORS['text'] + """;
 }
 .cover-page {
     page-break-after: always;
@@ -105,8 +190,8 @@ body {
     padding-top: 100px;
 }
 .cover-header {
-    background-color: """ + c['navy'] + """;
-    color: """ + c['white'] + """;
+    background-color: """ + _COLORS['navy'] + """;
+    color: """ + _COLORS['white'] + """;
     padding: 40px;
     margin-bottom: 30px;
 }
@@ -114,26 +199,26 @@ body {
     font-size: 28pt;
     font-weight: bold;
     margin-bottom: 10px;
-    color: """ + c['white'] + """;
+    color: """ + _COLORS['white'] + """;
 }
 .cover-subtitle {
     font-size: 14pt;
-    color: """ + c['white'] + """;
+    color: """ + _COLORS['white'] + """;
     margin-bottom: 8px;
 }
 .cover-domain {
     font-size: 16pt;
-    color: """ + c['blue_light'] + """;
+    color: """ + _COLORS['blue_light'] + """;
     margin-top: 16px;
 }
 .cover-meta {
     font-size: 11pt;
-    color: """ + c['text_light'] + """;
+    color: """ + _COLORS['text_light'] + """;
     margin-top: 20px;
 }
 .cover-summary {
     font-size: 11pt;
-    color: """ + c['text_light'] + """;
+    color: """ + _COLORS['text_light'] + """;
     margin-top: 20px;
     text-align: left;
     padding: 0 40px;
@@ -144,37 +229,37 @@ body {
 }
 .toc h2 {
     font-size: 20pt;
-    color: """ + c['navy'] + """;
-    border-bottom: 3px solid """ + c['blue'] + """;
+    color: """ + _COLORS['navy'] + """;
+    border-bottom: 3px solid """ + _COLORS['blue'] + """;
     padding-bottom: 8px;
     margin-bottom: 20px;
 }
 .toc-item {
     padding: 6px 0;
-    border-bottom: 1px dotted """ + c['border'] + """;
+    border-bottom: 1px dotted """ + _COLORS['border'] + """;
     font-size: 11pt;
 }
 .toc-number {
-    color: """ + c['blue'] + """;
+    color: """ + _COLORS['blue'] + """;
     font-weight: bold;
 }
 h1 {
     font-size: 20pt;
-    color: """ + c['navy'] + """;
-    border-bottom: 3px solid """ + c['blue'] + """;
+    color: """ + _COLORS['navy'] + """;
+    border-bottom: 3px solid """ + _COLORS['blue'] + """;
     padding-bottom: 8px;
     margin-top: 20px;
     margin-bottom: 12px;
 }
 h2 {
     font-size: 15pt;
-    color: """ + c['navy'] + """;
+    color: """ + _COLORS['navy'] + """;
     margin-top: 18px;
     margin-bottom: 10px;
 }
 h3 {
     font-size: 13pt;
-    color: """ + c['text'] + """;
+    color: """ + _COLORS['text'] + """;
     margin-top: 14px;
     margin-bottom: 8px;
 }
@@ -188,8 +273,8 @@ table {
     margin: 12px 0;
 }
 th {
-    background-color: """ + c['navy'] + """;
-    color: """ + c['white'] + """;
+    background-color: """ + _COLORS['navy'] + """;
+    color: """ + _COLORS['white'] + """;
     padding: 8px 10px;
     text-align: left;
     font-size: 10pt;
@@ -197,24 +282,24 @@ th {
 }
 td {
     padding: 7px 10px;
-    border-bottom: 1px solid """ + c['border'] + """;
+    border-bottom: 1px solid """ + _COLORS['border'] + """;
     font-size: 10pt;
 }
 tr {
-    background-color: """ + c['white'] + """;
+    background-color: """ + _COLORS['white'] + """;
 }
 caption {
     font-weight: bold;
     font-size: 11pt;
     margin-bottom: 6px;
     text-align: left;
-    color: """ + c['navy'] + """;
+    color: """ + _COLORS['navy'] + """;
 }
 .score-card {
     text-align: center;
     padding: 20px;
     margin: 15px 0;
-    border: 2px solid """ + c['border'] + """;
+    border: 2px solid """ + _COLORS['border'] + """;
 }
 .score-value {
     font-size: 48pt;
@@ -226,32 +311,32 @@ caption {
 }
 .score-label {
     font-size: 12pt;
-    color: """ + c['text_light'] + """;
+    color: """ + _COLORS['text_light'] + """;
     margin-top: 5px;
 }
 .severity-critical {
-    color: """ + c['red'] + """;
+    color: """ + _COLORS['red'] + """;
     font-weight: bold;
 }
 .severity-warning {
-    color: """ + c['yellow'] + """;
+    color: """ + _COLORS['yellow'] + """;
     font-weight: bold;
 }
 .severity-info {
-    color: """ + c['blue'] + """;
+    color: """ + _COLORS['blue'] + """;
     font-weight: bold;
 }
 .severity-good {
-    color: """ + c['green'] + """;
+    color: """ + _COLORS['green'] + """;
     font-weight: bold;
 }
 .metric-row {
     margin: 8px 0;
     padding: 8px;
-    border-bottom: 1px solid """ + c['border'] + """;
+    border-bottom: 1px solid """ + _COLORS['border'] + """;
 }
 .metric-label {
-    color: """ + c['text_light'] + """;
+    color: """ + _COLORS['text_light'] + """;
     font-size: 10pt;
 }
 .metric-value {
@@ -261,24 +346,24 @@ caption {
 .issue-item {
     padding: 8px;
     margin: 6px 0;
-    border-left: 3px solid """ + c['border'] + """;
+    border-left: 3px solid """ + _COLORS['border'] + """;
 }
 .priority-high {
-    color: """ + c['red'] + """;
+    color: """ + _COLORS['red'] + """;
     font-weight: bold;
 }
 .priority-medium {
-    color: """ + c['yellow'] + """;
+    color: """ + _COLORS['yellow'] + """;
     font-weight: bold;
 }
 .priority-low {
-    color: """ + c['blue'] + """;
+    color: """ + _COLORS['blue'] + """;
     font-weight: bold;
 }
 .rec-item {
     padding: 8px;
     margin: 6px 0;
-    border-left: 3px solid """ + c['green'] + """;
+    border-left: 3px solid """ + _COLORS['green'] + """;
 }
 .section {
     margin: 15px 0;
@@ -289,21 +374,22 @@ caption {
 }
 .chart-container img {
     max-width: 100%;
+    height: auto;
 }
 .footer-text {
     font-size: 9pt;
-    color: """ + c['gray'] + """;
+    color: """ + _COLORS['gray'] + """;
     text-align: center;
     margin-top: 20px;
 }
 .bar-container {
-    background-color: """ + c['gray_light'] + """;
+    background-color: """ + _COLORS['gray_light'] + """;
     height: 18px;
     margin: 4px 0;
 }
 .bar-fill {
     height: 18px;
-    color: """ + c['white'] + """;
+    color: """ + _COLORS['white'] + """;
     font-size: 9pt;
     padding-left: 5px;
     font-weight: bold;
@@ -312,28 +398,28 @@ caption {
     margin: 6px 0;
 }
 .summary-box {
-    background-color: """ + c['blue_bg'] + """;
+    background-color: """ + _COLORS['blue_bg'] + """;
     padding: 15px;
     margin: 12px 0;
-    border-left: 4px solid """ + c['blue'] + """;
+    border-left: 4px solid """ + _COLORS['blue'] + """;
 }
 .warning-box {
-    background-color: """ + c['yellow_bg'] + """;
+    background-color: """ + _COLORS['yellow_bg'] + """;
     padding: 15px;
     margin: 12px 0;
-    border-left: 4px solid """ + c['yellow'] + """;
+    border-left: 4px solid """ + _COLORS['yellow'] + """;
 }
 .error-box {
-    background-color: """ + c['red_bg'] + """;
+    background-color: """ + _COLORS['red_bg'] + """;
     padding: 15px;
     margin: 12px 0;
-    border-left: 4px solid """ + c['red'] + """;
+    border-left: 4px solid """ + _COLORS['red'] + """;
 }
 .success-box {
-    background-color: """ + c['green_bg'] + """;
+    background-color: """ + _COLORS['green_bg'] + """;
     padding: 15px;
     margin: 12px 0;
-    border-left: 4px solid """ + c['green'] + """;
+    border-left: 4px solid """ + _COLORS['green'] + """;
 }
 ul {
     margin-left: 20px;
@@ -343,12 +429,97 @@ li {
     margin-bottom: 4px;
 }
 """
-    return css
+
+
+_CSS_RULE_RE = re.compile(r'[^{}]+\{[^{}]*\}')
+_CSS_CLASS_RE = re.compile(r'\.([\w-]+)')
+_HTML_CLASS_RE = re.compile(r'class="([^"]+)"')
+
+# (rule text, classes its selector needs) parsed once from _CSS; rules
+# on bare tags / @page need no classes and are always kept.
+_CSS_RULES = tuple(
+    (m.group(0).strip(), frozenset(_CSS_CLASS_RE.findall(
+        m.group(0).split('{', 1)[0]
+    )))
+    for m in _CSS_RULE_RE.finditer(_CSS)
+)
+
+
+def _build_css(footer_text, used_classes=None):
+    """Return the xhtml2pdf-compatible CSS stylesheet.
+
+    With ``used_classes``, rules whose selectors reference a class that
+    never appears in the document are dropped, so the renderer does not
+    match them against every element.
+    """
+    if used_classes is None:
+        return _CSS
+    return '\n' + '\n'.join(
+        rule for rule, needed in _CSS_RULES if needed <= used_classes
+    ) + '\n'
+
+
+# ---------------------------------------------------------------------------
+# Fragment templates for repeated items (f-strings compile to a single
+# BUILD_STRING; string.Template would re-run a regex on every call)
+# ---------------------------------------------------------------------------
+def _paragraph_html(text):
+    """Render one escaped paragraph."""
+    return f'<p>{_escape_html(text)}</p>'
+
+
+def _finding_html(finding):
+    """Render one key-finding card."""
+    severity = finding.get('severity', 'info')
+    sev_color = _severity_color(severity)
+    sev = _escape_html(str(severity).upper())
+    title = _escape_html(finding.get('title', 'Finding'))
+    desc = _escape_html(finding.get('description', ''))
+    return (
+        f'<div class="finding-item">'
+        f'<div class="finding-header">'
+        f'<span class="finding-severity" style="background:{sev_color};">'
+        f'{sev}</span>'
+        f'<span class="finding-title">{title}</span>'
+        f'</div>'
+        f'<div class="finding-desc">{desc}</div>'
+        f'</div>'
+    )
+
+
+def _recommendation_html(item):
+    """Render one prioritised recommendation card."""
+    priority = item.get('priority', '')
+    p_color = _severity_color(priority)
+    p = _escape_html(str(priority).upper())
+    title = _escape_html(item.get('title', ''))
+    desc = _escape_html(item.get('description', ''))
+    steps = item.get('steps', [])
+    steps_html = ''
+    if steps:
+        li_items = ''.join(f'<li>{_escape_html(s)}</li>' for s in steps)
+        steps_html = f'<ol class="rec-steps">{li_items}</ol>'
+    return (
+        f'<div class="rec-item">'
+        f'<span class="rec-priority" style="background:{p_color};">'
+        f'{p}</span>'
+        f'<div class="rec-title">{title}</div>'
+        f'<div class="rec-desc">{desc}</div>'
+        f'{steps_html}'
+        f'</div>'
+    )
 
 
 class PDFReportBuilder:
     """Builder-pattern class for constructing professional PDF reports."""
 
+    # Styled matplotlib module, plus one Agg canvas and PNG buffer shared
+    # by every builder in the process; only touched under _render_lock
+    _PLT = None
+    _canvas = None
+    _png_buf = io.BytesIO()
+    _render_lock = threading.Lock()
+
     def __init__(
         self,
         title,
@@ -362,53 +533,39 @@ class PDFReportBuilder:
         self._company_name = company_name
         self._logo_path = logo_path
         self._theme = theme
-        self._sections = []
+        # Flat list of HTML fragments, joined once in build_html()
+        self._buffer = []
+        self._toc_slot = None
         self._toc_entries = []
         self._section_counter = 0
+        self._table_row_count = 0
+        # (buffer index, chart spec) pairs awaiting render in build_html()
+        self._chart_specs = []
         self._date_str = datetime.datetime.now().strftime('%Y-%m-%d')
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    @staticmethod
-    def _fig_to_base64(fig):
-        """Convert matplotlib figure to base64 PNG string."""
-        import base64
-        from io import BytesIO
-        import matplotlib.pyplot as plt
-
-        buf = BytesIO()
-        fig.savefig(
-            buf, format='png', dpi=150,
-            bbox_inches='tight', facecolor='white',
-        )
-        buf.seek(0)
-        img_b64 = base64.b64encode(buf.read()).decode('utf-8')
-        buf.close()
-        plt.close(fig)
-        return img_b64
+    def _end_section(self):
+        """Close a section; the TOC is spliced in after the first one."""
+        if self._toc_slot is None:
+            self._toc_slot = len(self._buffer)
 
     def _add_toc_entry(self, title):
         """Register a section for table of contents."""
         self._section_counter += 1
         self._toc_entries.append(title)
 
-    def _chart_img_tag(self, b64):
-        """Build an img tag from base64 data."""
-        return (
-            '<div class="chart-container">'
-            '<img src="data:image/png;base64,{b64}" alt="chart">'
-            '</div>'
-        ).format(b64=b64)
-
-    def _get_colors(self, n, colors=None):
+    @staticmethod
+    def _get_colors(n, colors=None):
         """Return n colors from palette or user-supplied list."""
         if colors and len(colors) >= n:
-            return colors[:n]
-        result = []
-        for i in range(n):
-            result.append(_CHART_PALETTE[i % len(_CHART_PALETTE)])
-        return result
+            return tuple(colors[:n])
+        if n < len(_PALETTE_PREFIX):
+            return _PALETTE_PREFIX[n]
+        return tuple(
+            _CHART_PALETTE[i % len(_CHART_PALETTE)] for i in range(n)
+        )
 
     # ------------------------------------------------------------------
     # Content methods (builder pattern - each returns self)
@@ -419,172 +576,130 @@ class PDFReportBuilder:
         logo_html = ''
         if self._logo_path and os.path.isfile(self._logo_path):
             logo_html = (
-                '<img src="{path}" style="max-height:60px;'
-                'margin-bottom:16px;" alt="logo">'
-            ).format(path=self._logo_path)
+                f'<img src="{_logo_data_uri(self._logo_path)}" '
+                f'style="max-height:60px;margin-bottom:16px;" alt="logo">'
+            )
+        title = _escape_html(self._title)
+        subtitle = _escape_html(self._subtitle)
+        company = (
+            _escape_html(self._company_name) if self._company_name else ''
+        )
         html = (
-            '<div class="cover-page">'
-            '{logo}'
-            '<div class="cover-header">'
-            '<div class="cover-title">{title}</div>'
-            '<div class="cover-subtitle">{subtitle}</div>'
-            '<div class="cover-domain">{domain}</div>'
-            '</div>'
-            '<div class="cover-meta">{company} &mdash; {date}</div>'
-            '<div class="cover-summary">{summary}</div>'
-            '</div>'
-        ).format(
-            logo=logo_html,
-            title=_escape_html(self._title),
-            subtitle=_escape_html(self._subtitle),
-            domain=_escape_html(domain),
-            company=_escape_html(self._company_name) if self._company_name else '',
-            date=_escape_html(date),
-            summary=_escape_html(summary_text),
+            f'<div class="cover-page">'
+            f'{logo_html}'
+            f'<div class="cover-header">'
+            f'<div class="cover-title">{title}</div>'
+            f'<div class="cover-subtitle">{subtitle}</div>'
+            f'<div class="cover-domain">{_escape_html(domain)}</div>'
+            f'</div>'
+            f'<div class="cover-meta">{company} &mdash; '
+            f'{_safe_date(date)}</div>'
+            f'<div class="cover-summary">{_escape_html(summary_text)}</div>'
+            f'</div>'
         )
-        self._sections.append({'type': 'raw', 'html': html})
+        self._buffer.append(html)
+        self._end_section()
         return self
 
     def add_executive_summary(self, paragraphs):
         """Add an executive summary section."""
         self._add_toc_entry('Executive Summary')
-        parts = ['<h1>Executive Summary</h1>', '<div class="exec-summary">']
-        for para in (paragraphs or []):
-            parts.append('<p>{0}</p>'.format(_escape_html(para)))
-        parts.append('</div>')
-        self._sections.append({'type': 'raw', 'html': '\n'.join(parts)})
+        buf = self._buffer
+        buf.append('<h1>Executive Summary</h1>')
+        buf.append('<div class="exec-summary">')
+        buf.extend(map(_paragraph_html, paragraphs or ()))
+        buf.append('</div>')
+        self._end_section()
         return self
 
     def add_section(self, title, paragraphs):
         """Add a titled section with paragraphs."""
         self._add_toc_entry(title)
-        parts = ['<h1>{0}</h1>'.format(_escape_html(title))]
-        for para in (paragraphs or []):
-            parts.append('<p>{0}</p>'.format(_escape_html(para)))
-        self._sections.append({'type': 'raw', 'html': '\n'.join(parts)})
+        buf = self._buffer
+        buf.append(f'<h1>{_escape_html(title)}</h1>')
+        buf.extend(map(_paragraph_html, paragraphs or ()))
+        self._end_section()
         return self
 
     def add_paragraph(self, text):
         """Add a standalone paragraph."""
-        html = '<p>{0}</p>'.format(_escape_html(text))
-        self._sections.append({'type': 'raw', 'html': html})
+        self._buffer.append(_paragraph_html(text))
+        self._end_section()
         return self
 
     def add_heading(self, text, level=2):
         """Add a heading (h2-h4)."""
         lvl = max(2, min(level, 4))
-        html = '<h{0}>{1}</h{0}>'.format(lvl, _escape_html(text))
-        self._sections.append({'type': 'raw', 'html': html})
+        self._buffer.append(f'<h{lvl}>{_escape_html(text)}</h{lvl}>')
+        self._end_section()
         return self
 
     def add_key_findings(self, findings):
         """Add key findings with severity badges."""
         self._add_toc_entry('Key Findings')
-        parts = ['<h1>Key Findings</h1>', '<div class="findings-list">']
-        for f in (findings or []):
-            title = f.get('title', 'Finding')
-            desc = f.get('description', '')
-            severity = f.get('severity', 'info')
-            sev_color = _severity_color(severity)
-            parts.append(
-                '<div class="finding-item">'
-                '<div class="finding-header">'
-                '<span class="finding-severity" style="background:{sc};">'
-                '{sev}</span>'
-                '<span class="finding-title">{t}</span>'
-                '</div>'
-                '<div class="finding-desc">{d}</div>'
-                '</div>'.format(
-                    sc=sev_color,
-                    sev=_escape_html(str(severity).upper()),
-                    t=_escape_html(title),
-                    d=_escape_html(desc),
-                )
-            )
-        parts.append('</div>')
-        self._sections.append({'type': 'raw', 'html': '\n'.join(parts)})
+        buf = self._buffer
+        buf.append('<h1>Key Findings</h1>')
+        buf.append('<div class="findings-list">')
+        buf.extend(map(_finding_html, findings or ()))
+        buf.append('</div>')
+        self._end_section()
         return self
 
     def add_metrics_summary(self, metrics):
         """Render metrics as styled flex cards."""
-        parts = ['<div class="metrics-grid">']
+        buf = self._buffer
+        buf.append('<div class="metrics-grid">')
         for label, value in (metrics or {}).items():
             display_val = value if value is not None else 'N/A'
-            parts.append(
-                '<div class="metric-card">'
-                '<div class="metric-value">{v}</div>'
-                '<div class="metric-label">{l}</div>'
-                '</div>'.format(
-                    v=_escape_html(str(display_val)),
-                    l=_escape_html(str(label)),
-                )
+            buf.append(
+                f'<div class="metric-card">'
+                f'<div class="metric-value">{_safe_num(display_val)}</div>'
+                f'<div class="metric-label">{_escape_html(label)}</div>'
+                f'</div>'
             )
-        parts.append('</div>')
-        self._sections.append({'type': 'raw', 'html': '\n'.join(parts)})
+        buf.append('</div>')
+        self._end_section()
         return self
 
     def add_recommendations(self, items):
         """Add prioritised recommendation cards."""
         self._add_toc_entry('Recommendations')
-        parts = ['<h1>Recommendations</h1>', '<div class="rec-list">']
-        for item in (items or []):
-            priority = item.get('priority', '')
-            title = item.get('title', '')
-            desc = item.get('description', '')
-            steps = item.get('steps', [])
-            p_color = _severity_color(priority)
-            steps_html = ''
-            if steps:
-                li_items = ''.join(
-                    '<li>{0}</li>'.format(_escape_html(s)) for s in steps
-                )
-                steps_html = '<ol class="rec-steps">{0}</ol>'.format(li_items)
-            parts.append(
-                '<div class="rec-item">'
-                '<span class="rec-priority" style="background:{pc};">'
-                '{p}</span>'
-                '<div class="rec-title">{t}</div>'
-                '<div class="rec-desc">{d}</div>'
-                '{steps}'
-                '</div>'.format(
-                    pc=p_color,
-                    p=_escape_html(str(priority).upper()),
-                    t=_escape_html(title),
-                    d=_escape_html(desc),
-                    steps=steps_html,
-                )
-            )
-        parts.append('</div>')
-        self._sections.append({'type': 'raw', 'html': '\n'.join(parts)})
+        buf = self._buffer
+        buf.append('<h1>Recommendations</h1>')
+        buf.append('<div class="rec-list">')
+        buf.extend(map(_recommendation_html, items or ()))
+        buf.append('</div>')
+        self._end_section()
         return self
 
     def add_table(self, headers, rows, caption=''):
         """Add a styled data table."""
-        parts = ['<table>']
+        buf = self._buffer
+        buf.append('<table>')
         if caption:
-            parts.append('<caption>{0}</caption>'.format(_escape_html(caption)))
-        hdr_cells = ''.join(
-            '<th>{0}</th>'.format(_escape_html(str(h))) for h in headers
-        )
-        parts.append('<thead><tr>{0}</tr></thead>'.format(hdr_cells))
-        parts.append('<tbody>')
-        for row in (rows or []):
+            buf.append(f'<caption>{_escape_html(caption)}</caption>')
+        hdr_cells = ''.join(f'<th>{_escape_html(h)}</th>' for h in headers)
+        buf.append(f'<thead><tr>{hdr_cells}</tr></thead>')
+        buf.append('<tbody>')
+        rows = list(rows or ())
+        self._table_row_count += len(rows)
+        for row in rows:
             cells = ''.join(
-                '<td>{0}</td>'.format(
-                    _escape_html(str(v) if v is not None else 'N/A')
-                )
+                '<td>N/A</td>' if v is None
+                else '<td>' + (
+                    str(v) if isinstance(v, _SAFE_TYPES) else _escape_html(v)
+                ) + '</td>'
                 for v in row
             )
-            parts.append('<tr>{0}</tr>'.format(cells))
-        parts.append('</tbody></table>')
-        self._sections.append({'type': 'raw', 'html': '\n'.join(parts)})
+            buf.append('<tr>%s</tr>' % cells)
+        buf.append('</tbody></table>')
+        self._end_section()
         return self
 
     def add_page_break(self):
         """Insert a manual page break."""
-        self._sections.append(
-            {'type': 'raw', 'html': '<div class="page-break"></div>'}
-        )
+        self._buffer.append('<div class="page-break"></div>')
+        self._end_section()
         return self
 
     # ------------------------------------------------------------------
@@ -593,75 +708,153 @@ class PDFReportBuilder:
     def add_score_card(self, score, grade, label='Overall Score'):
         """Add a large centred score card with color coding."""
         score_val = score if score is not None else 0
-        color = _score_color(score_val)
+        c = _score_color(score_val)
         bg = _score_bg(score_val)
-        html = (
-            '<div class="score-card" style="background:{bg};">'
-            '<div class="score-value" style="color:{c};">{s}</div>'
-            '<div class="score-grade" style="color:{c};">{g}</div>'
-            '<div class="score-label">{l}</div>'
-            '</div>'
-        ).format(
-            bg=bg, c=color,
-            s=_escape_html(str(score_val)),
-            g=_escape_html(str(grade)),
-            l=_escape_html(str(label)),
+        self._buffer.append(
+            f'<div class="score-card" style="background:{bg};">'
+            f'<div class="score-value" style="color:{c};">'
+            f'{_safe_num(score_val)}</div>'
+            f'<div class="score-grade" style="color:{c};">'
+            f'{_escape_html(grade)}</div>'
+            f'<div class="score-label">{_escape_html(label)}</div>'
+            f'</div>'
         )
-        self._sections.append({'type': 'raw', 'html': html})
+        self._end_section()
         return self
 
     def add_category_scores(self, scores):
         """Add horizontal progress bars for category scores."""
-        parts = ['<div class="category-scores">']
+        buf = self._buffer
+        buf.append('<div class="category-scores">')
         for name, val in (scores or {}).items():
             safe_val = float(val) if val is not None else 0
             clamped = max(0.0, min(100.0, safe_val))
-            color = _score_color(clamped)
-            parts.append(
-                '<div class="cat-score-row">'
-                '<span class="cat-score-label">{name}</span>'
-                '<div class="cat-score-bar-bg">'
-                '<div class="cat-score-bar" '
-                'style="width:{w}%;background:{c};"></div>'
-                '</div>'
-                '<span class="cat-score-val" style="color:{c};">{v}</span>'
-                '</div>'.format(
-                    name=_escape_html(str(name)),
-                    w=int(clamped),
-                    c=color,
-                    v=int(clamped),
-                )
+            c = _score_color(clamped)
+            w = int(clamped)
+            buf.append(
+                f'<div class="cat-score-row">'
+                f'<span class="cat-score-label">{_escape_html(name)}</span>'
+                f'<div class="cat-score-bar-bg">'
+                f'<div class="cat-score-bar" '
+                f'style="width:{w}%;background:{c};"></div>'
+                f'</div>'
+                f'<span class="cat-score-val" style="color:{c};">{w}</span>'
+                f'</div>'
             )
-        parts.append('</div>')
-        self._sections.append({'type': 'raw', 'html': '\n'.join(parts)})
+        buf.append('</div>')
+        self._end_section()
         return self
 
     # ------------------------------------------------------------------
-    # Chart methods (lazy-import matplotlib)
+    # Chart rendering (lazy-import matplotlib)
+    #
+    # The add_*_chart methods only record a hashable spec and reserve a
+    # buffer slot; build_html() renders all pending specs together, on
+    # the warm per-process figure.
     # ------------------------------------------------------------------
-    def _import_plt(self):
-        """Lazy-import matplotlib with Agg backend."""
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-        try:
-            plt.style.use('seaborn-v0_8-whitegrid')
-        except OSError:
+    @classmethod
+    def _import_plt(cls):
+        """Lazy-import matplotlib with Agg backend (once per process)."""
+        if PDFReportBuilder._PLT is None:
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
             try:
-                plt.style.use('seaborn-whitegrid')
+                plt.style.use('seaborn-v0_8-whitegrid')
             except OSError:
-                pass
-        return plt
+                try:
+                    plt.style.use('seaborn-whitegrid')
+                except OSError:
+                    pass
+            # DejaVu Sans ships with matplotlib; pinning it skips the
+            # font-manager search through the style's fallback list.
+            matplotlib.rcParams['font.family'] = 'sans-serif'
+            matplotlib.rcParams['font.sans-serif'] = ['DejaVu Sans']
+            PDFReportBuilder._PLT = plt
+        return PDFReportBuilder._PLT
+
+    @classmethod
+    def _new_figure(cls, figsize, projection=None):
+        """Return the persistent figure, cleared, plus fresh axes.
+
+        One Agg canvas per process, shared by all builders, is reused for
+        every chart instead of creating and tearing down a pyplot figure
+        each time; callers must hold ``_render_lock``. Constrained
+        layout stands in for ``tight_layout`` / ``bbox_inches='tight'``,
+        so the PNG is rendered in a single pass at ``figsize * dpi``.
+        """
+        if cls._canvas is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            cls._canvas = FigureCanvasAgg(Figure(
+                figsize=figsize, dpi=150, facecolor='white',
+                layout='constrained',
+            ))
+        fig = cls._canvas.figure
+        fig.clear()
+        fig.set_size_inches(figsize)
+        return fig, fig.add_subplot(projection=projection)
+
+    @classmethod
+    def _fig_to_base64(cls, fig):
+        """Convert the persistent figure to ``(base64 PNG, width, height)``.
+
+        Encodes through the process-wide ``_png_buf``, so like
+        ``_new_figure`` it must run under ``_render_lock``.
+
+        The pixel size is known from ``figsize * dpi``, so it is returned
+        for the img tag rather than probed from the PNG header later.
+        """
+        import base64
 
-    def add_bar_chart(self, labels, values, title,
-                      xlabel='', ylabel='', colors=None):
-        """Add a vertical bar chart."""
-        plt = self._import_plt()
-        if not labels or not values:
-            return self
+        buf = cls._png_buf
+        buf.seek(0)
+        buf.truncate(0)
+        fig.canvas.print_png(buf)
+        # Encode straight from the buffer's memory (no bytes copy); the
+        # view must be released before the buffer can be truncated again
+        with buf.getbuffer() as view:
+            b64 = base64.b64encode(view).decode('ascii')
+        dpi = fig.get_dpi()
+        return (
+            b64,
+            round(fig.get_figwidth() * dpi),
+            round(fig.get_figheight() * dpi),
+        )
+
+    @staticmethod
+    def _chart_img_tag(b64, width, height):
+        """Build a sized img tag from base64 PNG data."""
+        return (
+            f'<div class="chart-container">'
+            f'<img src="data:image/png;base64,{b64}" '
+            f'width="{width}" height="{height}" alt="chart">'
+            f'</div>'
+        )
+
+    @staticmethod
+    def _svg_img_tag(svg):
+        """Build an img tag embedding SVG markup as a data URI.
+
+        xhtml2pdf ignores inline ``<svg>`` elements but renders SVG
+        images (via svglib) as vectors; Chromium and WeasyPrint accept
+        both forms.
+        """
+        import base64
+
+        b64 = base64.b64encode(svg.encode('utf-8')).decode('ascii')
+        return (
+            f'<div class="chart-container">'
+            f'<img src="data:image/svg+xml;base64,{b64}" alt="chart">'
+            f'</div>'
+        )
+
+    @classmethod
+    def _render_bar(cls, labels, values, title, xlabel, ylabel, bar_colors):
+        """Render a vertical bar chart spec."""
+        cls._import_plt()
         n = len(labels)
-        bar_colors = self._get_colors(n, colors)
-        fig, ax = plt.subplots(figsize=(8, 4.5))
+        fig, ax = cls._new_figure((8, 4.5))
         ax.bar(
             range(n), values, color=bar_colors,
             width=0.6, edgecolor='white', linewidth=0.5,
@@ -678,19 +871,14 @@ class PDFReportBuilder:
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.grid(axis='y', alpha=0.3)
-        fig.tight_layout()
-        b64 = self._fig_to_base64(fig)
-        self._sections.append({'type': 'raw', 'html': self._chart_img_tag(b64)})
-        return self
+        return cls._chart_img_tag(*cls._fig_to_base64(fig))
 
-    def add_horizontal_bar_chart(self, labels, values, title, colors=None):
-        """Add a horizontal bar chart."""
-        plt = self._import_plt()
-        if not labels or not values:
-            return self
+    @classmethod
+    def _render_hbar(cls, labels, values, title, bar_colors):
+        """Render a horizontal bar chart spec."""
+        cls._import_plt()
         n = len(labels)
-        bar_colors = self._get_colors(n, colors)
-        fig, ax = plt.subplots(figsize=(8, max(3, n * 0.5 + 1)))
+        fig, ax = cls._new_figure((8, max(3, n * 0.5 + 1)))
         y_pos = range(n)
         ax.barh(
             y_pos, values, color=bar_colors,
@@ -703,19 +891,13 @@ class PDFReportBuilder:
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.grid(axis='x', alpha=0.3)
-        fig.tight_layout()
-        b64 = self._fig_to_base64(fig)
-        self._sections.append({'type': 'raw', 'html': self._chart_img_tag(b64)})
-        return self
+        return cls._chart_img_tag(*cls._fig_to_base64(fig))
 
-    def add_pie_chart(self, labels, values, title, colors=None):
-        """Add a pie chart."""
-        plt = self._import_plt()
-        if not labels or not values:
-            return self
-        n = len(labels)
-        pie_colors = self._get_colors(n, colors)
-        fig, ax = plt.subplots(figsize=(6, 5))
+    @classmethod
+    def _render_pie(cls, labels, values, title, pie_colors):
+        """Render a pie chart spec."""
+        cls._import_plt()
+        fig, ax = cls._new_figure((6, 5))
         wedges, texts, autotexts = ax.pie(
             values,
             labels=[str(lb) for lb in labels],
@@ -730,20 +912,14 @@ class PDFReportBuilder:
             at.set_color('white')
             at.set_fontweight('bold')
         ax.set_title(title, fontsize=13, fontweight='bold', pad=14)
-        fig.tight_layout()
-        b64 = self._fig_to_base64(fig)
-        self._sections.append({'type': 'raw', 'html': self._chart_img_tag(b64)})
-        return self
-
-    def add_line_chart(self, x_data, y_data_dict, title,
-                       xlabel='', ylabel=''):
-        """Add a multi-series line chart."""
-        plt = self._import_plt()
-        if not x_data or not y_data_dict:
-            return self
-        fig, ax = plt.subplots(figsize=(8, 4.5))
-        line_colors = self._get_colors(len(y_data_dict))
-        for idx, (series_name, y_vals) in enumerate(y_data_dict.items()):
+        return cls._chart_img_tag(*cls._fig_to_base64(fig))
+
+    @classmethod
+    def _render_line(cls, x_data, series, title, xlabel, ylabel, line_colors):
+        """Render a multi-series line chart spec."""
+        cls._import_plt()
+        fig, ax = cls._new_figure((8, 4.5))
+        for idx, (series_name, y_vals) in enumerate(series):
             ax.plot(
                 x_data[:len(y_vals)], y_vals,
                 color=line_colors[idx],
@@ -760,96 +936,220 @@ class PDFReportBuilder:
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.grid(alpha=0.3)
-        if len(y_data_dict) > 1:
+        if len(series) > 1:
             ax.legend(fontsize=9, framealpha=0.9)
-        fig.tight_layout()
-        b64 = self._fig_to_base64(fig)
-        self._sections.append({'type': 'raw', 'html': self._chart_img_tag(b64)})
-        return self
-
-    def add_gauge_chart(self, value, max_val=100, title='', thresholds=None):
-        """Add a semi-circle gauge chart."""
-        plt = self._import_plt()
-        import numpy as np
+        return cls._chart_img_tag(*cls._fig_to_base64(fig))
 
+    @classmethod
+    def _render_gauge(cls, value, max_val, title, thresholds=None):
+        """Render a semi-circle gauge chart spec as hand-written SVG."""
         safe_val = float(value) if value is not None else 0
         safe_max = float(max_val) if max_val else 100
         ratio = min(safe_val / safe_max, 1.0) if safe_max > 0 else 0
+        ratio = max(ratio, 0.0)
+        if thresholds is None:
+            gauge_color = _score_color(safe_val)
+        else:
+            warn, good = thresholds
+            gauge_color = _SCORE_COLORS[(safe_val >= warn) + (safe_val >= good)]
+
+        # Arc centred at (100, 110), radius 80, drawn left-to-right over
+        # the top; the value arc ends at 180 - 180 * ratio degrees.
+        theta = math.pi * (1 - ratio)
+        x2 = 100 + 80 * math.cos(theta)
+        y2 = 110 - 80 * math.sin(theta)
+        parts = [
+            '<svg xmlns="http://www.w3.org/2000/svg" width="360" '
+            'height="252" viewBox="0 0 200 140" '
+            'font-family="Helvetica, Arial, sans-serif">',
+            f'<path d="M20,110 A80,80 0 0,1 180,110" fill="none" '
+            f'stroke="{_COLORS["border"]}" stroke-width="18"/>',
+        ]
+        if ratio > 0:
+            parts.append(
+                f'<path d="M20,110 A80,80 0 0,1 {x2:.2f},{y2:.2f}" '
+                f'fill="none" stroke="{gauge_color}" stroke-width="18"/>'
+            )
+        parts.append(
+            f'<text x="100" y="104" text-anchor="middle" font-size="28" '
+            f'font-weight="bold" fill="{gauge_color}">{int(safe_val)}</text>'
+        )
+        if title:
+            parts.append(
+                f'<text x="100" y="132" text-anchor="middle" font-size="10" '
+                f'fill="{_COLORS["text_light"]}">{_escape_html(title)}</text>'
+            )
+        parts.append('</svg>')
+        return cls._svg_img_tag(''.join(parts))
+
+    @classmethod
+    def _render_radar(cls, categories, values, title):
+        """Render a radar / spider chart spec as hand-written SVG."""
+        n = len(categories)
+        vals = [float(v) if v is not None else 0.0 for v in values[:n]]
+        vals += [0.0] * (n - len(vals))
+        r_max = max(vals) if vals and max(vals) > 0 else 1.0
+        cx, cy, radius = 150, 165, 100
+        unit = _radar_unit_vectors(n)
+        border = _COLORS['border']
+        blue = _COLORS['blue']
+        text = _COLORS['text']
+        parts = [
+            '<svg xmlns="http://www.w3.org/2000/svg" width="360" '
+            'height="360" viewBox="0 0 300 300" '
+            'font-family="Helvetica, Arial, sans-serif">',
+            f'<text x="150" y="22" text-anchor="middle" font-size="13" '
+            f'font-weight="bold" fill="{text}">{_escape_html(title)}</text>',
+        ]
+        for frac in (0.25, 0.5, 0.75, 1.0):
+            parts.append(
+                f'<circle cx="{cx}" cy="{cy}" r="{radius * frac:.1f}" '
+                f'fill="none" stroke="{border}"/>'
+            )
+        for ux, uy in unit:
+            parts.append(
+                f'<line x1="{cx}" y1="{cy}" x2="{cx + radius * ux:.2f}" '
+                f'y2="{cy - radius * uy:.2f}" stroke="{border}"/>'
+            )
+        points = ' '.join(
+            f'{cx + radius * v / r_max * ux:.2f},'
+            f'{cy - radius * v / r_max * uy:.2f}'
+            for v, (ux, uy) in zip(vals, unit)
+        )
+        parts.append(
+            f'<polygon points="{points}" fill="{blue}" fill-opacity="0.15" '
+            f'stroke="{blue}" stroke-width="2"/>'
+        )
+        for cat, (ux, uy) in zip(categories, unit):
+            anchor = 'middle'
+            if ux > 0.3:
+                anchor = 'start'
+            elif ux < -0.3:
+                anchor = 'end'
+            parts.append(
+                f'<text x="{cx + (radius + 10) * ux:.2f}" '
+                f'y="{cy - (radius + 10) * uy + 3:.2f}" '
+                f'text-anchor="{anchor}" font-size="9" '
+                f'fill="{text}">{_escape_html(cat)}</text>'
+            )
+        parts.append('</svg>')
+        return cls._svg_img_tag(''.join(parts))
+
+    def _add_chart(self, kind, *args):
+        """Reserve a buffer slot for a chart spec rendered at build time."""
+        self._buffer.append('')
+        self._chart_specs.append((len(self._buffer) - 1, (kind,) + args))
+        self._end_section()
+        return self
+
+    @staticmethod
+    def _render_specs(specs):
+        """Render chart specs in-process, matplotlib ones under the lock."""
+        rendered = [None] * len(specs)
+        raster = []
+        for pos, spec in enumerate(specs):
+            if spec[0] in _SVG_CHARTS:
+                rendered[pos] = _render_chart_spec(spec)
+            else:
+                raster.append(pos)
+        if raster:
+            # The shared canvas is not thread-safe
+            with PDFReportBuilder._render_lock:
+                for pos in raster:
+                    rendered[pos] = _render_chart_spec(specs[pos])
+        return rendered
+
+    def _render_charts(self):
+        """Render pending chart specs into their reserved buffer slots.
+
+        Identical specs render once per build and are served from the
+        module-level LRU cache on later builds.
+        """
+        pending = self._chart_specs
+        if not pending:
+            return
+        keys = [_chart_cache_key(spec) for _, spec in pending]
+        html_by_key = {}
+        with _chart_cache_lock:
+            for key in keys:
+                if key in _chart_cache:
+                    _chart_cache.move_to_end(key)
+                    html_by_key[key] = _chart_cache[key]
+        todo = {}
+        for key, (_, spec) in zip(keys, pending):
+            if key not in html_by_key:
+                todo.setdefault(key, spec)
+        if todo:
+            rendered = self._render_specs(list(todo.values()))
+            html_by_key.update(zip(todo, rendered))
+            with _chart_cache_lock:
+                _chart_cache.update(zip(todo, rendered))
+                while len(_chart_cache) > _CHART_CACHE_SIZE:
+                    _chart_cache.popitem(last=False)
+        for key, (idx, _) in zip(keys, pending):
+            self._buffer[idx] = html_by_key[key]
+        self._chart_specs = []
+
+    def add_bar_chart(self, labels, values, title,
+                      xlabel='', ylabel='', colors=None):
+        """Add a vertical bar chart."""
+        if not labels or not values:
+            return self
+        return self._add_chart(
+            'bar', tuple(labels), tuple(values), title, xlabel, ylabel,
+            self._get_colors(len(labels), colors),
+        )
 
-        fig, ax = plt.subplots(figsize=(5, 3.5))
+    def add_horizontal_bar_chart(self, labels, values, title, colors=None):
+        """Add a horizontal bar chart."""
+        if not labels or not values:
+            return self
+        return self._add_chart(
+            'hbar', tuple(labels), tuple(values), title,
+            self._get_colors(len(labels), colors),
+        )
 
-        # Draw gauge arcs manually using matplotlib patches
-        from matplotlib.patches import Arc
-        # Background arc
-        arc_bg = Arc(
-            (0.5, 0.0), 0.8, 0.8, angle=0,
-            theta1=0, theta2=180,
-            color=_COLORS['border'], linewidth=18,
+    def add_pie_chart(self, labels, values, title, colors=None):
+        """Add a pie chart."""
+        if not labels or not values:
+            return self
+        return self._add_chart(
+            'pie', tuple(labels), tuple(values), title,
+            self._get_colors(len(labels), colors),
         )
-        ax.add_patch(arc_bg)
-
-        # Value arc
-        gauge_color = _score_color(safe_val)
-        theta_end = 180 * ratio
-        arc_val = Arc(
-            (0.5, 0.0), 0.8, 0.8, angle=0,
-            theta1=180 - theta_end, theta2=180,
-            color=gauge_color, linewidth=18,
+
+    def add_line_chart(self, x_data, y_data_dict, title,
+                       xlabel='', ylabel=''):
+        """Add a multi-series line chart."""
+        if not x_data or not y_data_dict:
+            return self
+        series = tuple(
+            (name, tuple(vals)) for name, vals in y_data_dict.items()
         )
-        ax.add_patch(arc_val)
-
-        # Centre text
-        ax.text(
-            0.5, 0.15, str(int(safe_val)),
-            ha='center', va='center',
-            fontsize=28, fontweight='bold',
-            color=gauge_color,
+        return self._add_chart(
+            'line', tuple(x_data), series, title, xlabel, ylabel,
+            self._get_colors(len(series)),
         )
-        if title:
-            ax.text(
-                0.5, -0.15, title,
-                ha='center', va='center',
-                fontsize=10, color=_COLORS['text_light'],
-            )
 
-        ax.set_xlim(-0.1, 1.1)
-        ax.set_ylim(-0.3, 0.6)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        fig.tight_layout()
-        b64 = self._fig_to_base64(fig)
-        self._sections.append({'type': 'raw', 'html': self._chart_img_tag(b64)})
-        return self
+    def add_gauge_chart(self, value, max_val=100, title='', thresholds=None):
+        """Add a semi-circle gauge chart.
+
+        ``thresholds`` is a ``(warning, good)`` pair: the arc is red below
+        ``warning``, yellow below ``good`` and green from there on. It
+        defaults to the 60 / 80 score buckets used across the report.
+        """
+        if thresholds is not None:
+            warn, good = thresholds
+            thresholds = (float(warn), float(good))
+        return self._add_chart('gauge', value, max_val, title, thresholds)
 
     def add_radar_chart(self, categories, values, title):
         """Add a radar / spider chart."""
-        plt = self._import_plt()
-        import numpy as np
-
         if not categories or not values:
             return self
-
-        n = len(categories)
-        angles = np.linspace(0, 2 * np.pi, n, endpoint=False).tolist()
-        plot_vals = list(values) + [values[0]]
-        angles_closed = angles + [angles[0]]
-
-        fig, ax = plt.subplots(
-            figsize=(5.5, 5.5), subplot_kw={'projection': 'polar'},
+        return self._add_chart(
+            'radar', tuple(categories), tuple(values), title,
         )
-        ax.plot(angles_closed, plot_vals, color=_COLORS['blue'], linewidth=2)
-        ax.fill(angles_closed, plot_vals, color=_COLORS['blue'], alpha=0.15)
-
-        ax.set_xticks(angles)
-        ax.set_xticklabels([str(c) for c in categories], fontsize=9)
-        ax.set_title(title, fontsize=13, fontweight='bold', pad=20, y=1.08)
-        ax.spines['polar'].set_color(_COLORS['border'])
-        ax.grid(color=_COLORS['border'], alpha=0.5)
-
-        fig.tight_layout()
-        b64 = self._fig_to_base64(fig)
-        self._sections.append({'type': 'raw', 'html': self._chart_img_tag(b64)})
-        return self
 
     # ------------------------------------------------------------------
     # Build methods
@@ -858,120 +1158,334 @@ class PDFReportBuilder:
         """Generate table of contents HTML."""
         if not self._toc_entries:
             return ''
-        parts = [
-            '<div class="toc">',
-            '<h2>Table of Contents</h2>',
-        ]
-        for idx, entry in enumerate(self._toc_entries, 1):
-            parts.append(
-                '<div class="toc-item">'
-                '<span class="toc-number">{n}.</span> {t}'
-                '</div>'.format(
-                    n=idx,
-                    t=_escape_html(entry),
-                )
-            )
-        parts.append('</div>')
-        return '\n'.join(parts)
+        items = ''.join(
+            f'<div class="toc-item">'
+            f'<span class="toc-number">{idx}.</span> {_escape_html(entry)}'
+            f'</div>'
+            for idx, entry in enumerate(self._toc_entries, 1)
+        )
+        return f'<div class="toc"><h2>Table of Contents</h2>{items}</div>'
+
+    def _iter_html(self):
+        """Yield the complete HTML document as a sequence of fragments."""
+        self._render_charts()
+        company = self._company_name or 'SEO Report'
+        footer_text = f'{company} | {self._date_str}'
+        buf = self._buffer
+        toc_html = self._build_toc_html() if buf else ''
+        used_classes = set()
+        for fragment in (toc_html, *buf):
+            for match in _HTML_CLASS_RE.finditer(fragment):
+                used_classes.update(match.group(1).split())
+        css = _build_css(footer_text, used_classes)
+
+        yield (
+            f'<!DOCTYPE html>\n'
+            f'<html lang="en">\n'
+            f'<head>\n'
+            f'<meta charset="utf-8">\n'
+            f'<meta name="viewport" '
+            f'content="width=device-width, initial-scale=1">\n'
+            f'<title>{_escape_html(self._title)}</title>\n'
+            f'<style>{css}</style>\n'
+            f'</head>\n'
+            f'<body>\n'
+        )
+
+        # Splice the TOC in after the first section (the cover page)
+        slot = self._toc_slot if self._toc_slot is not None else len(buf)
+        yield from buf[:slot]
+        yield toc_html
+        yield from buf[slot:]
+        yield '\n</body>\n</html>'
 
     def build_html(self):
         """Build the complete HTML document."""
-        footer_text = '{0} | {1}'.format(
-            self._company_name or 'SEO Report',
-            self._date_str,
-        )
-        css = _build_css(footer_text)
+        return ''.join(self._iter_html())
 
-        body_parts = []
-        for section in self._sections:
-            body_parts.append(section.get('html', ''))
+    def build_html_to_stream(self, stream):
+        """Write the HTML document, UTF-8 encoded, to a binary stream.
 
-        # Insert TOC after cover page (first section)
-        toc_html = self._build_toc_html()
-        if toc_html and len(body_parts) > 0:
-            body_parts.insert(1, toc_html)
+        Fragments are written one at a time so large reports never need
+        the whole document as a single string.
+        """
+        write = stream.write
+        for fragment in self._iter_html():
+            write(fragment.encode('utf-8'))
 
-        html = (
-            '<!DOCTYPE html>\n'
-            '<html lang="en">\n'
-            '<head>\n'
-            '<meta charset="utf-8">\n'
-            '<meta name="viewport" '
-            'content="width=device-width, initial-scale=1">\n'
-            '<title>{title}</title>\n'
-            '<style>{css}</style>\n'
-            '</head>\n'
-            '<body>\n'
-            '{body}\n'
-            '</body>\n'
-            '</html>'
-        ).format(
-            title=_escape_html(self._title),
-            css=css,
-            body='\n'.join(body_parts),
+    # ------------------------------------------------------------------
+    # PDF backends
+    # ------------------------------------------------------------------
+    def _pdf_via_chromium(self, src, filepath):
+        """Render with headless Chromium (Skia). False if unavailable.
+
+        The browser is launched for this call only and always closed, so
+        no Playwright driver or Chromium process outlives it in whatever
+        thread (Streamlit script run, ``to_thread`` worker) called it.
+        The HTML is streamed to a temporary file that Chromium loads from
+        disk, rather than read back into one string.
+        """
+        try:
+            from playwright.sync_api import Error as PlaywrightError
+            from playwright.sync_api import sync_playwright
+        except ImportError:
+            return False
+        with tempfile.NamedTemporaryFile(
+            suffix='.html', delete=False,
+        ) as html_file:
+            src.seek(0)
+            shutil.copyfileobj(src, html_file)
+        try:
+            with sync_playwright() as pw:
+                browser = pw.chromium.launch()
+                try:
+                    page = browser.new_page()
+                    page.goto(
+                        pathlib.Path(html_file.name).as_uri(), wait_until='load',
+                    )
+                    page.pdf(path=filepath, format='A4', print_background=True)
+                finally:
+                    browser.close()
+        except PlaywrightError:
+            # Browser binaries missing, sync API used inside an event loop,
+            # or the render itself failed or timed out: use the next backend
+            return False
+        finally:
+            os.remove(html_file.name)
+        return True
+
+    def _pdf_via_xhtml2pdf(self, src, filepath):
+        """Render with xhtml2pdf (pure Python). False if unavailable."""
+        try:
+            from xhtml2pdf import pisa
+        except ImportError:
+            return False
+        src.seek(0)
+        # Render into memory and write the file in one call: ReportLab
+        # emits many small writes, and a failed run leaves no partial PDF.
+        pdf = io.BytesIO()
+        result = pisa.CreatePDF(src, dest=pdf, encoding='utf-8')
+        if result.err:
+            raise RuntimeError('xhtml2pdf conversion had errors')
+        with open(filepath, 'wb') as pdf_file:
+            pdf_file.write(pdf.getbuffer())
+        return True
+
+    def _pdf_via_weasyprint(self, src, filepath):
+        """Render with WeasyPrint (requires GTK on Windows)."""
+        try:
+            from weasyprint import HTML as WeasyprintHTML
+            src.seek(0)
+            WeasyprintHTML(file_obj=src, encoding='utf-8').write_pdf(filepath)
+        except (ImportError, OSError):
+            return False
+        return True
+
+    def _render_pdf(self, src, filepath):
+        """Render the HTML in binary stream ``src``; True on success.
+
+        Backends are tried in ``_PDF_BACKENDS`` order, with WeasyPrint
+        ahead of xhtml2pdf for table-heavy reports.
+        """
+        backends = (
+            _LARGE_TABLE_BACKENDS
+            if self._table_row_count > _LARGE_TABLE_ROWS
+            else _PDF_BACKENDS
+        )
+        for backend in backends:
+            if getattr(self, '_pdf_via_' + backend)(src, filepath):
+                return True
+        return False
+
+    def _state_key(self):
+        """Stable content hash of everything that feeds the rendered PDF."""
+        state = (
+            self._title, self._subtitle, self._company_name,
+            self._logo_path, self._theme, self._date_str,
+            self._buffer, self._toc_slot, self._toc_entries,
+            [spec for _, spec in self._chart_specs],
         )
-        return html
+        return hashlib.blake2b(
+            pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL),
+            digest_size=20,
+        ).hexdigest()
 
-    def build_pdf(self, filepath):
-        """Build PDF and save to filepath. Returns the file path."""
-        html_content = self.build_html()
+    @staticmethod
+    def _store_cached_pdf(filepath, cached):
+        """Copy a rendered PDF into the cache, evicting the oldest files."""
+        os.makedirs(_PDF_CACHE_DIR, exist_ok=True)
+        shutil.copyfile(filepath, cached)
+        entries = sorted(
+            os.scandir(_PDF_CACHE_DIR), key=lambda e: e.stat().st_mtime,
+        )
+        for entry in entries[:-_PDF_CACHE_SIZE]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def build_pdf(self, filepath, use_cache=False):
+        """Build PDF and save to filepath. Returns the file path.
+
+        With ``use_cache``, a PDF previously built from identical builder
+        state is copied from ``data/cache/pdf`` instead of re-rendered.
+        """
         dirpath = os.path.dirname(filepath)
         if dirpath:
             os.makedirs(dirpath, exist_ok=True)
 
-        # Try xhtml2pdf first (pure Python, works on all platforms)
-        try:
-            from xhtml2pdf import pisa
-            with open(filepath, 'wb') as pdf_file:
-                result = pisa.CreatePDF(html_content, dest=pdf_file)
-                if result.err:
-                    raise RuntimeError('xhtml2pdf conversion had errors')
-            return filepath
-        except ImportError:
-            pass
+        cached = None
+        if use_cache:
+            cached = os.path.join(_PDF_CACHE_DIR, self._state_key() + '.pdf')
+            try:
+                shutil.copyfile(cached, filepath)
+                os.utime(cached)  # mark as recently used
+                return filepath
+            except OSError:
+                pass
+
+        # Spool the HTML (in memory up to 8 MB, then on disk) rather than
+        # materialising one giant string for the renderer.
+        with tempfile.SpooledTemporaryFile(
+            max_size=_HTML_SPOOL_SIZE, mode='w+b',
+        ) as src:
+            self.build_html_to_stream(src)
+            if self._render_pdf(src, filepath):
+                if cached:
+                    try:
+                        self._store_cached_pdf(filepath, cached)
+                    except OSError:
+                        pass
+                return filepath
 
-        # Fallback to WeasyPrint (requires GTK on Windows)
-        try:
-            from weasyprint import HTML as WeasyprintHTML
-            WeasyprintHTML(string=html_content).write_pdf(filepath)
-            return filepath
-        except (ImportError, OSError) as e:
             # Last resort: save as HTML
             html_path = filepath.replace('.pdf', '.html')
-            with open(html_path, 'w', encoding='utf-8') as fh:
-                fh.write(html_content)
-            raise RuntimeError(
-                'PDF generation requires xhtml2pdf or weasyprint. '
-                'Install with: pip install xhtml2pdf. '
-                'HTML report saved to: {0}'.format(html_path)
-            ) from e
+            src.seek(0)
+            with open(html_path, 'wb') as fh:
+                shutil.copyfileobj(src, fh)
+        raise RuntimeError(
+            'PDF generation requires playwright, xhtml2pdf or weasyprint. '
+            'Install with: pip install xhtml2pdf. '
+            f'HTML report saved to: {html_path}'
+        )
+
+    @classmethod
+    def build_pdfs_parallel(cls, items, max_workers=None):
+        """Build many reports at once from ``(builder, filepath)`` pairs.
+
+        xhtml2pdf is pure Python and GIL-bound, so each PDF is rendered
+        in its own worker process. Charts are rendered here first, so
+        the workers only run the PDF conversion and identical charts are
+        shared through the chart cache. Returns the output paths in
+        input order.
+        """
+        items = list(items)
+        for builder, _ in items:
+            builder._render_charts()
+        if len(items) < 2:
+            return [_build_one(item) for item in items]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_build_one, items))
+
+    async def build_pdf_async(self, filepath, use_cache=False):
+        """Build the PDF in a worker process without blocking the loop.
+
+        The PDF backends are CPU-bound and hold the GIL, so they run in
+        a shared process pool; charts are rendered here first so they
+        still go through the chart cache. Falls back to a thread if the
+        pool cannot be used. Returns the file path.
+        """
+        import asyncio
+
+        self._render_charts()
+        loop = asyncio.get_running_loop()
+        pool = None
+        try:
+            pool = _get_pdf_pool()
+            future = loop.run_in_executor(
+                pool, _build_one, (self, filepath), use_cache,
+            )
+        except (OSError, BrokenProcessPool):
+            # The pool could not be started or no longer accepts work
+            _reset_pdf_pool(pool)
+            return await asyncio.to_thread(self.build_pdf, filepath, use_cache)
+        try:
+            return await future
+        except BrokenProcessPool:
+            # A worker died; anything else the build raised propagates
+            _reset_pdf_pool(pool)
+            return await asyncio.to_thread(self.build_pdf, filepath, use_cache)
 
     def build_both(self, filepath_base):
         """Build both HTML and PDF. Returns (html_path, pdf_path)."""
-        html_path = '{0}.html'.format(filepath_base)
-        pdf_path = '{0}.pdf'.format(filepath_base)
+        html_path = f'{filepath_base}.html'
+        pdf_path = f'{filepath_base}.pdf'
 
-        html_content = self.build_html()
         dirpath = os.path.dirname(html_path)
         if dirpath:
             os.makedirs(dirpath, exist_ok=True)
 
-        with open(html_path, 'w', encoding='utf-8') as fh:
-            fh.write(html_content)
-
-        # Try xhtml2pdf first (pure Python, works on all platforms)
-        try:
-            from xhtml2pdf import pisa
-            with open(pdf_path, 'wb') as pdf_file:
-                result = pisa.CreatePDF(html_content, dest=pdf_file)
-                if result.err:
-                    raise RuntimeError('xhtml2pdf conversion had errors')
-        except ImportError:
-            # Fallback to WeasyPrint
-            try:
-                from weasyprint import HTML as WeasyprintHTML
-                WeasyprintHTML(string=html_content).write_pdf(pdf_path)
-            except (ImportError, OSError):
+        with open(html_path, 'w+b') as src:
+            self.build_html_to_stream(src)
+            if not self._render_pdf(src, pdf_path):
                 pdf_path = html_path  # Return HTML path if PDF fails
 
         return (html_path, pdf_path)
+
+
+def _build_one(item, use_cache=False):
+    """Build one ``(builder, filepath)`` pair (process-pool entry point)."""
+    builder, filepath = item
+    return builder.build_pdf(filepath, use_cache=use_cache)
+
+
+def _get_pdf_pool():
+    """Return the shared PDF worker pool, creating it on first use."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _pdf_pool
+
+
+def _reset_pdf_pool(broken):
+    """Discard the broken PDF worker pool so the next call starts afresh.
+
+    Only drops the shared pool if it is still *broken*: another caller
+    may already have replaced it, and that pool's queued builds must not
+    be cancelled.
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if broken is None or _pdf_pool is not broken:
+            return
+        _pdf_pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _logo_data_uri(path):
+    """Return the image at *path* as a data URI.
+
+    Embedded like the charts, so every backend finds the logo wherever
+    it resolves relative URLs from (Chromium loads the HTML from a temp
+    file) and the saved HTML stays self-contained.
+    """
+    import base64
+    import mimetypes
+
+    mime = mimetypes.guess_type(path)[0] or 'image/png'
+    with open(path, 'rb') as fh:
+        b64 = base64.b64encode(fh.read()).decode('ascii')
+    return f'data:{mime};base64,{b64}'
+
+
+def _chart_cache_key(spec):
+    """Content hash of a chart spec (labels, values, title, colours)."""
+    return hashlib.blake2b(
+        pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16,
+    ).digest()
+
+
+def _render_chart_spec(spec):
+    """Render one chart spec to HTML (module-level for process pools)."""
+    return getattr(PDFReportBuilder, '_render_' + spec[0])(*spec[1:])
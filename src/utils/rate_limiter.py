@@ -1,6 +1,7 @@
 """Configurable async-compatible rate limiter with sliding window."""
 
 import asyncio
+import collections
 import logging
 import time
 from typing import Optional
@@ -33,15 +34,20 @@ class RateLimiter:
         self._rpm = requests_per_minute
         self._rph = requests_per_hour
         self._name = name
-        self._minute_window: list[float] = []
-        self._hour_window: list[float] = []
+        self._minute_window: collections.deque[float] = collections.deque()
+        self._hour_window: collections.deque[float] = collections.deque()
         self._async_lock = asyncio.Lock()
 
     def _clean_windows(self, now: float) -> None:
         """Remove expired timestamps from sliding windows."""
-        self._minute_window = [t for t in self._minute_window if now - t < 60.0]
+        # Timestamps are appended in order, so expired ones sit at the left
+        minute = self._minute_window
+        while minute and now - minute[0] >= 60.0:
+            minute.popleft()
         if self._rph:
-            self._hour_window = [t for t in self._hour_window if now - t < 3600.0]
+            hour = self._hour_window
+            while hour and now - hour[0] >= 3600.0:
+                hour.popleft()
 
     def _wait_time(self) -> float:
         """Calculate how long to wait before the next request is allowed."""
@@ -54,15 +60,32 @@ class RateLimiter:
             wait = max(wait, 3600.0 - (now - self._hour_window[0]))
         return wait
 
-    def _record(self) -> None:
+    def _record(self, now: Optional[float] = None) -> None:
         """Record a request timestamp."""
-        now = time.monotonic()
+        if now is None:
+            now = time.monotonic()
         self._minute_window.append(now)
         if self._rph:
             self._hour_window.append(now)
 
+    def _try_record_fast(self, now: float) -> bool:
+        """Record the request if the windows are under capacity.
+
+        Window sizes only shrink when pruned, so a window below its limit
+        before pruning is certainly below it after; no clean-up is needed
+        to admit the request.
+        """
+        if len(self._minute_window) >= self._rpm:
+            return False
+        if self._rph and len(self._hour_window) >= self._rph:
+            return False
+        self._record(now)
+        return True
+
     def acquire_sync(self) -> None:
         """Block until a request slot is available (synchronous)."""
+        if self._try_record_fast(time.monotonic()):
+            return
         while True:
             wait = self._wait_time()
             if wait <= 0:
@@ -72,8 +95,17 @@ class RateLimiter:
         self._record()
 
     async def acquire(self) -> None:
-        """Wait until a request slot is available (async)."""
+        """Wait until a request slot is available (async).
+
+        The lock doubles as a FIFO wait queue: only the coroutine holding
+        it sleeps, for exactly the time until the oldest timestamp
+        expires, while later callers are parked on the lock and are not
+        polled. Slots only free up with time, never on release, so there
+        is nothing to notify.
+        """
         async with self._async_lock:
+            if self._try_record_fast(time.monotonic()):
+                return
             while True:
                 wait = self._wait_time()
                 if wait <= 0:
@@ -1,8 +1,37 @@
 """Text processing utilities for SEO content analysis."""
 
+import functools
 import re
 from collections import Counter
-from typing import Any
+from heapq import nlargest
+from operator import itemgetter
+from typing import NamedTuple
+
+_ENTITY_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b')
+# One alternative per level instead of a </h\1> backreference: the
+# pattern stays regular (DFA-compatible) and the level is the index of
+# the group that matched.
+_HEADING_RE = re.compile(
+    '<h(?:'
+    + '|'.join(rf'{n}(?:\s[^>]*)?>([\s\S]*?)</h{n}>' for n in range(1, 7))
+    + ')',
+    re.IGNORECASE,
+)
+_TAG_STRIP_RE = re.compile(r'<[^>]+>')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+
+# Shared label strings for output records (no per-match allocation)
+_ENTITY_TYPE = "ENTITY"
+_H_LEVELS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+
+class Entity(NamedTuple):
+    """A named-entity-like phrase and how often it occurs."""
+
+    text: str
+    type: str
+    count: int
 
 
 def count_words(text: str) -> int:
@@ -26,7 +55,10 @@ def calculate_readability(text: str) -> dict[str, float]:
     """
     sentences = _split_sentences(text)
     words = text.split()
-    syllable_count = sum(_count_syllables(w) for w in words)
+    # Keep the per-token iteration in C; the joined length is the exact
+    # non-whitespace character count without summing per-word ints.
+    char_count = len(''.join(words))
+    syllable_count = sum(map(_count_syllables, words))
 
     num_sentences = max(len(sentences), 1)
     num_words = max(len(words), 1)
@@ -39,8 +71,7 @@ def calculate_readability(text: str) -> dict[str, float]:
     fkgl = 0.39 * (num_words / num_sentences) + 11.8 * (num_syllables / num_words) - 15.59
 
     # Automated Readability Index
-    num_chars = sum(len(w) for w in words)
-    ari = 4.71 * (num_chars / num_words) + 0.5 * (num_words / num_sentences) - 21.43
+    ari = 4.71 * (char_count / num_words) + 0.5 * (num_words / num_sentences) - 21.43
 
     return {
         "flesch_reading_ease": round(max(0.0, min(100.0, fre)), 1),
@@ -49,21 +80,19 @@ def calculate_readability(text: str) -> dict[str, float]:
     }
 
 
-def extract_entities(text: str) -> list[dict[str, Any]]:
+def extract_entities(text: str) -> list[Entity]:
     """Extract named-entity-like patterns from text (lightweight, no NLP model).
 
     Finds capitalised multi-word phrases as potential entities.
 
     Returns:
-        List of entity dicts with text, type, and count.
+        List of :class:`Entity` records (text, type, count), most
+        frequent first. Use ``entity._asdict()`` where a dict is needed.
     """
-    pattern = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b')
-    matches = pattern.findall(text)
-    counter = Counter(matches)
-    entities = []
-    for entity_text, count in counter.most_common(50):
-        entities.append({"text": entity_text, "type": "ENTITY", "count": count})
-    return entities
+    counter = Counter(m.group(1) for m in _ENTITY_RE.finditer(text))
+    # Partial top-50 selection; ties keep first-seen order like most_common
+    top = nlargest(50, counter.items(), key=itemgetter(1))
+    return [Entity(entity_text, _ENTITY_TYPE, count) for entity_text, count in top]
 
 
 def calculate_keyword_density(
@@ -78,24 +107,34 @@ def calculate_keyword_density(
     Returns:
         Dict with density_pct, count, and total_words.
     """
-    text_lower = text.lower()
     keyword_lower = keyword.lower().strip()
+    if not keyword_lower:
+        return {"density_pct": 0.0, "count": 0, "total_words": 0}
+    text_lower = text.lower()
     words = text_lower.split()
     total_words = len(words)
 
-    if total_words == 0 or not keyword_lower:
+    if total_words == 0:
         return {"density_pct": 0.0, "count": 0, "total_words": 0}
 
     kw_words = keyword_lower.split()
     kw_len = len(kw_words)
     count = 0
 
-    if kw_len == 1:
+    if kw_words[0] not in text_lower:
+        pass  # substring scan rules out any token match
+    elif kw_len == 1:
         count = words.count(keyword_lower)
     else:
-        for i in range(len(words) - kw_len + 1):
-            if words[i : i + kw_len] == kw_words:
-                count += 1
+        # Scan the space-joined tokens in C; step one word past each hit
+        # so overlapping phrases ("a a" in "a a a") still count twice.
+        haystack = f" {' '.join(words)} "
+        needle = f" {' '.join(kw_words)} "
+        step = len(kw_words[0]) + 1
+        pos = haystack.find(needle)
+        while pos != -1:
+            count += 1
+            pos = haystack.find(needle, pos + step)
 
     density = (count * kw_len / total_words) * 100
     return {
@@ -111,13 +150,12 @@ def extract_headings(html: str) -> list[dict[str, str]]:
     Returns:
         List of dicts with level and text.
     """
-    pattern = re.compile(r'<h([1-6])[^>]*>(.*?)</h\1>', re.IGNORECASE | re.DOTALL)
     headings = []
-    for match in pattern.finditer(html):
-        level = match.group(1)
-        text = re.sub(r'<[^>]+>', '', match.group(2)).strip()
+    for match in _HEADING_RE.finditer(html):
+        level = match.lastindex
+        text = _TAG_STRIP_RE.sub('', match.group(level)).strip()
         if text:
-            headings.append({"level": f"h{level}", "text": text})
+            headings.append({"level": _H_LEVELS[level - 1], "text": text})
     return headings
 
 
@@ -127,26 +165,31 @@ def extract_headings(html: str) -> list[dict[str, str]]:
 
 def _split_sentences(text: str) -> list[str]:
     """Split text into sentences using basic heuristics."""
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+    sentences = _SENTENCE_SPLIT_RE.split(text.strip())
     return [s for s in sentences if s.strip()]
 
 
+@functools.lru_cache(maxsize=131072)
 def _count_syllables(word: str) -> int:
-    """Estimate syllable count for an English word."""
-    word = word.lower().strip(".,!?;:'\"-()")
+    """Estimate syllable count for an English word.
+
+    Cached on the raw token so repeated words skip normalisation too;
+    case and punctuation variants still share ``_syllables_clean``.
+    """
+    return _syllables_clean(word.lower().strip(".,!?;:'\"-()"))
+
+
+@functools.lru_cache(maxsize=131072)
+def _syllables_clean(word: str) -> int:
+    """Syllable count for an already lower-cased, stripped word (memoised)."""
     if not word:
         return 0
     if len(word) <= 3:
         return 1
 
     vowels = "aeiouy"
-    count = 0
-    prev_vowel = False
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not prev_vowel:
-            count += 1
-        prev_vowel = is_vowel
+    # Each run of consecutive vowels is one syllable nucleus
+    count = len(_VOWEL_GROUP_RE.findall(word))
 
     # Adjust for silent 'e'
     if word.endswith("e") and count > 1:
@@ -1,7 +1,33 @@
 """Input validation utilities for URLs, emails, and domains."""
 
-import re
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
+
+# Translation table deleting every character allowed in an email local part
+_EMAIL_LOCAL_STRIP = str.maketrans(
+    "", "",
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    ".!#$%&'*+/=?^_`{|}~-",
+)
+# Translation table deleting every character allowed in a domain label;
+# anything left over after translate() is invalid.
+_LABEL_STRIP = str.maketrans("", "", "abcdefghijklmnopqrstuvwxyz0123456789-")
+# Prefixes marking a string as an absolute web URL
+_URL_SCHEMES = ("http://", "https://")
+
+
+def normalize_url(domain: str) -> str:
+    """Return *domain* as an absolute URL, defaulting to https.
+
+    Args:
+        domain: A bare domain (``example.com``) or an http(s) URL.
+
+    Returns:
+        The URL unchanged if it already has an http(s) scheme, otherwise
+        ``https://`` + domain.
+    """
+    if domain.startswith(_URL_SCHEMES):
+        return domain
+    return f"https://{domain}"
 
 
 def validate_url(url: str) -> tuple[bool, str]:
@@ -17,7 +43,7 @@ def validate_url(url: str) -> tuple[bool, str]:
         return False, "URL is empty or not a string."
     url = url.strip()
     try:
-        parsed = urlparse(url)
+        parsed = urlsplit(url)
     except Exception as exc:
         return False, f"URL parse error: {exc}"
     if parsed.scheme not in ("http", "https"):
@@ -42,18 +68,28 @@ def validate_email(email: str) -> tuple[bool, str]:
     if not email or not isinstance(email, str):
         return False, "Email is empty or not a string."
     email = email.strip()
-    pattern = re.compile(
-        r"^[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@"
-        r"[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
-        r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
-    )
-    if not pattern.match(email):
-        return False, "Email format is invalid."
     if len(email) > 320:
         return False, "Email exceeds maximum length (320 chars)."
-    domain = email.split("@")[1]
+    if not email.isascii():
+        return False, "Email format is invalid."
+    local, at, domain = email.partition("@")
+    if not at:
+        return False, "Email format is invalid."
     if "." not in domain:
         return False, "Email domain must contain at least one dot."
+    # Character-class checks via translate(): whatever survives deletion
+    # of the allowed characters is invalid.
+    if not local or local.translate(_EMAIL_LOCAL_STRIP):
+        return False, "Email format is invalid."
+    for label in domain.lower().split("."):
+        if (
+            not label
+            or len(label) > 63
+            or label[0] == "-"
+            or label[-1] == "-"
+            or label.translate(_LABEL_STRIP)
+        ):
+            return False, "Email format is invalid."
     return True, ""
 
 
@@ -85,6 +121,6 @@ def validate_domain(domain: str) -> tuple[bool, str]:
             return False, "Domain contains empty label (double dot)."
         if len(label) > 63:
             return False, f"Label '{label}' exceeds 63 chars."
-        if not re.match(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$", label):
+        if label[0] == "-" or label[-1] == "-" or label.translate(_LABEL_STRIP):
             return False, f"Label '{label}' contains invalid characters."
     return True, ""
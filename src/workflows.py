@@ -1,220 +1,468 @@
 """Workflow engine connecting all modules into automated SEO pipelines."""
 
 import asyncio
+import collections
+import contextlib
+import contextvars
+import functools
+import importlib
+import inspect
+import itertools
 import logging
+import operator
+import os
 import time
-from datetime import datetime
-from typing import Any, Optional
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, NamedTuple, Optional, Sequence
+
+from src.utils.validators import normalize_url
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _import_module(module_path: str):
+    """importlib.import_module memoised per module path."""
+    return importlib.import_module(module_path)
+
+
+class _Step(NamedTuple):
+    """One node of a pipeline's step graph, as run by ``_run_dag``."""
+
+    key: str
+    index: int
+    description: str
+    run: Callable[[], Awaitable[dict[str, Any]]]
+    deps: tuple[str, ...] = ()
+    # Seconds before _run_step abandons the step; None runs it to completion
+    timeout: Optional[float] = None
+
+
+# (pipeline name, total steps) of the pipeline run in the current context;
+# asyncio tasks copy it, so steps gathered in parallel log under their run.
+_pipeline_ctx: contextvars.ContextVar[tuple[str, int]] = contextvars.ContextVar("pipeline_ctx")
+
+
+def _in_pipeline(name: str, total: int):
+    """Run the decorated pipeline method with ``_pipeline_ctx`` set."""
+    def decorate(func):
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def gen_wrapper(*args, **kwargs):
+                token = _pipeline_ctx.set((name, total))
+                try:
+                    async for item in func(*args, **kwargs):
+                        yield item
+                finally:
+                    # An abandoned generator is finalised from another task,
+                    # whose context the token does not belong to
+                    with contextlib.suppress(ValueError):
+                        _pipeline_ctx.reset(token)
+            return gen_wrapper
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            token = _pipeline_ctx.set((name, total))
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _pipeline_ctx.reset(token)
+        return wrapper
+    return decorate
+
+
 class WorkflowEngine:
     """Orchestrate multi-step SEO pipelines across all modules.
 
-    Each pipeline method runs a sequence of steps. Every step is wrapped in
-    try/except so that a single module failure does not abort the entire
-    pipeline.  Results are collected per-step and returned as a dict.
+    Each pipeline method runs a sequence of steps through ``_run_step``,
+    which catches failures so that a single module failure does not abort
+    the entire pipeline.  Results are collected per-step and returned as a dict.
 
     Usage::
 
-        engine = WorkflowEngine()
+        engine = WorkflowEngine.instance()
         results = await engine.run_full_seo_pipeline("example.com", ["seo tools"])
     """
 
-    def __init__(self) -> None:
-        self._llm_client = None
-        self._technical_auditor = None
-        self._onpage_optimizer = None
-        self._schema_generator = None
-        self._keyword_researcher = None
-        self._keyword_analyzer = None
-        self._topical_researcher = None
-        self._blog_writer = None
-        self._quality_checker = None
-        self._content_manager = None
-        self._link_prospector = None
-        self._outreach_manager = None
-        self._backlink_monitor = None
-        self._rank_tracker = None
-        self._serp_analyzer = None
-        self._local_seo_analyzer = None
-        self._local_report_generator = None
-        self._report_engine = None
-        self._report_renderer = None
-        self._seo_news_scraper = None
+    # Lazily constructed collaborators: name -> (module, class, llm kwarg).
+    # The llm kwarg names the constructor argument that receives the shared
+    # LLM client, or is None for classes built without arguments.
+    _REGISTRY: dict[str, tuple[str, str, Optional[str]]] = {
+        "llm_client": ("src.integrations.llm_client", "LLMClient", None),
+        "technical_auditor": ("src.modules.technical_audit", "TechnicalAuditor", "llm_client"),
+        "onpage_optimizer": ("src.modules.onpage_seo", "OnPageOptimizer", "llm_client"),
+        "schema_generator": ("src.modules.onpage_seo", "SchemaGenerator", None),
+        "keyword_researcher": ("src.modules.keyword_research", "KeywordResearcher", "llm_client"),
+        "keyword_analyzer": ("src.modules.keyword_research", "KeywordAnalyzer", None),
+        "topical_researcher": ("src.modules.topical_research", "TopicalResearcher", "llm_client"),
+        "blog_writer": ("src.modules.blog_content", "BlogContentWriter", "llm_client"),
+        "quality_checker": ("src.modules.blog_content", "ContentQualityChecker", "llm_client"),
+        "content_manager": ("src.modules.blog_content", "ContentManager", None),
+        "link_prospector": ("src.modules.link_building", "LinkProspector", "llm_client"),
+        "outreach_manager": ("src.modules.link_building", "OutreachManager", "llm_client"),
+        "backlink_monitor": ("src.modules.link_building", "BacklinkMonitor", "llm_client"),
+        "rank_tracker": ("src.modules.rank_tracker", "RankTracker", None),
+        "serp_analyzer": ("src.modules.rank_tracker", "SERPAnalyzer", None),
+        "local_seo_analyzer": ("src.modules.local_seo", "LocalSEOAnalyzer", "llm_client"),
+        "local_report_generator": ("src.modules.local_seo", "LocalSEOReportGenerator", None),
+        "citation_checker": ("src.modules.local_seo", "CitationChecker", None),
+        # Holds a browser that each run closes, so it is built by _new(), not cached
+        "gmb_analyzer": ("src.modules.local_seo", "GMBAnalyzer", None),
+        "report_engine": ("src.modules.reporting", "ReportEngine", "llm"),
+        "report_renderer": ("src.modules.reporting", "ReportRenderer", None),
+        "seo_news_scraper": ("src.modules.seo_news.scraper", "SEONewsScraper", None),
+    }
+
+    # Registry entries each pipeline touches, imported up front by _preload()
+    _PIPELINE_COMPONENTS: dict[str, tuple[str, ...]] = {
+        "full_seo": (
+            "technical_auditor", "onpage_optimizer", "keyword_researcher",
+            "topical_researcher", "blog_writer", "quality_checker",
+            "link_prospector", "rank_tracker", "local_seo_analyzer",
+            "report_engine", "report_renderer",
+        ),
+        "content": (
+            "keyword_researcher", "topical_researcher", "blog_writer",
+            "quality_checker", "schema_generator",
+        ),
+        "link_building": ("backlink_monitor", "link_prospector", "outreach_manager"),
+        "monitoring": (
+            "backlink_monitor", "rank_tracker", "serp_analyzer",
+            "seo_news_scraper", "report_engine",
+        ),
+        "local_seo": (
+            "local_seo_analyzer", "citation_checker", "gmb_analyzer",
+            "rank_tracker", "topical_researcher", "local_report_generator",
+        ),
+    }
+
+    # Engines handed out by instance(), least recently used first
+    _shared: "collections.OrderedDict[str, WorkflowEngine]" = collections.OrderedDict()
+    _SHARED_MAX = 64
+
+    # Idempotent research lookups memoised per (call, keyword) by _cached()
+    _RESEARCH_CACHE_SIZE = 1024
+    _RESEARCH_TTL = 3600.0
+
+    # Budgets for steps bounded by a few LLM or browser calls, which can
+    # hang; crawls, bulk tracking and scrapes scale with the site and run
+    # without a limit
+    _LLM_STEP_TIMEOUT = 600.0
+    _BROWSER_STEP_TIMEOUT = 300.0
+
+    def __init__(
+        self,
+        max_parallel: Optional[int] = None,
+        step_sink: Optional[Callable[[str, str, dict[str, Any]], None]] = None,
+    ) -> None:
+        self._instances: dict[str, Any] = {}
         self._pipeline_status: dict[str, Any] = {}
+        # Cap on in-flight LLM/HTTP calls across all running pipelines
+        self._max_parallel = max_parallel or int(os.getenv("WORKFLOW_MAX_PARALLEL", "8"))
+        self._semaphore: Optional[asyncio.BoundedSemaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._research_cache: collections.OrderedDict[tuple[str, str], tuple[float, Any]] = (
+            collections.OrderedDict()
+        )
+        self._research_inflight: dict[tuple[str, str], asyncio.Future] = {}
+        # Optional blocking callback (pipeline, step key, entry) that stores
+        # each finished step; run in a worker thread behind the next step
+        self._step_sink = step_sink
+        # Step writes not yet stored, per pipeline, so _finish only waits
+        # for its own pipeline's writes on a shared engine
+        self._pending_writes: dict[str, set[asyncio.Task]] = {}
         logger.info("WorkflowEngine initialized.")
 
+    @classmethod
+    def instance(cls, key: str = "default") -> "WorkflowEngine":
+        """Return the shared engine for *key*, creating it on first use.
+
+        Prefer this over ``WorkflowEngine()`` so the lazily built module
+        instances (and the LLM client they share) survive between runs.
+        Distinct keys (e.g. one per tenant) get distinct engines; at most
+        ``_SHARED_MAX`` are kept. The least recently used one is only
+        dropped from the cache, not closed: a caller may still be running
+        a pipeline on it, and whoever holds it last closes it.
+        """
+        engine = cls._shared.get(key)
+        if engine is not None:
+            cls._shared.move_to_end(key)
+            return engine
+        engine = cls._shared[key] = cls()
+        if len(cls._shared) > cls._SHARED_MAX:
+            cls._shared.popitem(last=False)
+        return engine
+
+    async def close(self) -> None:
+        """Close every created module instance that holds open connections."""
+        instances, self._instances = self._instances, {}
+        for name, instance in instances.items():
+            closer = getattr(instance, "close", None)
+            if closer is None or not asyncio.iscoroutinefunction(closer):
+                continue
+            try:
+                await closer()
+            except Exception as exc:
+                logger.warning("Closing %s failed: %s", name, exc)
+
     # ------------------------------------------------------------------
     # Lazy-loaded module accessors
     # ------------------------------------------------------------------
 
-    def _get_llm_client(self):
-        if self._llm_client is None:
-            from src.integrations.llm_client import LLMClient
-            self._llm_client = LLMClient()
-            logger.debug("LLMClient created.")
-        return self._llm_client
-
-    def _get_technical_auditor(self):
-        if self._technical_auditor is None:
-            from src.modules.technical_audit import TechnicalAuditor
-            self._technical_auditor = TechnicalAuditor(llm_client=self._get_llm_client())
-            logger.debug("TechnicalAuditor created.")
-        return self._technical_auditor
-
-    def _get_onpage_optimizer(self):
-        if self._onpage_optimizer is None:
-            from src.modules.onpage_seo import OnPageOptimizer
-            self._onpage_optimizer = OnPageOptimizer(llm_client=self._get_llm_client())
-            logger.debug("OnPageOptimizer created.")
-        return self._onpage_optimizer
-
-    def _get_schema_generator(self):
-        if self._schema_generator is None:
-            from src.modules.onpage_seo import SchemaGenerator
-            self._schema_generator = SchemaGenerator()
-            logger.debug("SchemaGenerator created.")
-        return self._schema_generator
-
-    def _get_keyword_researcher(self):
-        if self._keyword_researcher is None:
-            from src.modules.keyword_research import KeywordResearcher
-            self._keyword_researcher = KeywordResearcher(llm_client=self._get_llm_client())
-            logger.debug("KeywordResearcher created.")
-        return self._keyword_researcher
-
-    def _get_keyword_analyzer(self):
-        if self._keyword_analyzer is None:
-            from src.modules.keyword_research import KeywordAnalyzer
-            self._keyword_analyzer = KeywordAnalyzer()
-            logger.debug("KeywordAnalyzer created.")
-        return self._keyword_analyzer
-
-    def _get_topical_researcher(self):
-        if self._topical_researcher is None:
-            from src.modules.topical_research import TopicalResearcher
-            self._topical_researcher = TopicalResearcher(llm_client=self._get_llm_client())
-            logger.debug("TopicalResearcher created.")
-        return self._topical_researcher
-
-    def _get_blog_writer(self):
-        if self._blog_writer is None:
-            from src.modules.blog_content import BlogContentWriter
-            self._blog_writer = BlogContentWriter(llm_client=self._get_llm_client())
-            logger.debug("BlogContentWriter created.")
-        return self._blog_writer
-
-    def _get_quality_checker(self):
-        if self._quality_checker is None:
-            from src.modules.blog_content import ContentQualityChecker
-            self._quality_checker = ContentQualityChecker(llm_client=self._get_llm_client())
-            logger.debug("ContentQualityChecker created.")
-        return self._quality_checker
-
-    def _get_content_manager(self):
-        if self._content_manager is None:
-            from src.modules.blog_content import ContentManager
-            self._content_manager = ContentManager()
-            logger.debug("ContentManager created.")
-        return self._content_manager
-
-    def _get_link_prospector(self):
-        if self._link_prospector is None:
-            from src.modules.link_building import LinkProspector
-            self._link_prospector = LinkProspector(llm_client=self._get_llm_client())
-            logger.debug("LinkProspector created.")
-        return self._link_prospector
-
-    def _get_outreach_manager(self):
-        if self._outreach_manager is None:
-            from src.modules.link_building import OutreachManager
-            self._outreach_manager = OutreachManager(llm_client=self._get_llm_client())
-            logger.debug("OutreachManager created.")
-        return self._outreach_manager
-
-    def _get_backlink_monitor(self):
-        if self._backlink_monitor is None:
-            from src.modules.link_building import BacklinkMonitor
-            self._backlink_monitor = BacklinkMonitor(llm_client=self._get_llm_client())
-            logger.debug("BacklinkMonitor created.")
-        return self._backlink_monitor
-
-    def _get_rank_tracker(self):
-        if self._rank_tracker is None:
-            from src.modules.rank_tracker import RankTracker
-            self._rank_tracker = RankTracker()
-            logger.debug("RankTracker created.")
-        return self._rank_tracker
-
-    def _get_serp_analyzer(self):
-        if self._serp_analyzer is None:
-            from src.modules.rank_tracker import SERPAnalyzer
-            self._serp_analyzer = SERPAnalyzer()
-            logger.debug("SERPAnalyzer created.")
-        return self._serp_analyzer
-
-    def _get_local_seo_analyzer(self):
-        if self._local_seo_analyzer is None:
-            from src.modules.local_seo import LocalSEOAnalyzer
-            self._local_seo_analyzer = LocalSEOAnalyzer(llm_client=self._get_llm_client())
-            logger.debug("LocalSEOAnalyzer created.")
-        return self._local_seo_analyzer
-
-    def _get_local_report_generator(self):
-        if self._local_report_generator is None:
-            from src.modules.local_seo import LocalSEOReportGenerator
-            self._local_report_generator = LocalSEOReportGenerator()
-            logger.debug("LocalSEOReportGenerator created.")
-        return self._local_report_generator
-
-    def _get_report_engine(self):
-        if self._report_engine is None:
-            from src.modules.reporting import ReportEngine
-            self._report_engine = ReportEngine(llm=self._get_llm_client())
-            logger.debug("ReportEngine created.")
-        return self._report_engine
-
-    def _get_report_renderer(self):
-        if self._report_renderer is None:
-            from src.modules.reporting import ReportRenderer
-            self._report_renderer = ReportRenderer()
-            logger.debug("ReportRenderer created.")
-        return self._report_renderer
-
-    def _get_seo_news_scraper(self):
-        if self._seo_news_scraper is None:
-            from src.modules.seo_news.scraper import SEONewsScraper
-            self._seo_news_scraper = SEONewsScraper()
-            logger.debug("SEONewsScraper created.")
-        return self._seo_news_scraper
+    def _new(self, name: str) -> Any:
+        """Build a fresh instance of the class registered as *name*."""
+        module_path, class_name, llm_kwarg = self._REGISTRY[name]
+        cls = getattr(_import_module(module_path), class_name)
+        if llm_kwarg:
+            instance = cls(**{llm_kwarg: self._get("llm_client")})
+        else:
+            instance = cls()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s created.", class_name)
+        return instance
+
+    def _get(self, name: str) -> Any:
+        """Return the shared instance registered as *name*, creating it once."""
+        instance = self._instances.get(name)
+        if instance is None:
+            instance = self._instances[name] = self._new(name)
+        return instance
+
+    async def _preload(self) -> None:
+        """Import the pipeline's modules in worker threads, concurrently.
+
+        First-time imports of the heavy module packages would otherwise run
+        on the event loop inside the first ``_get_*`` call. Import errors
+        are ignored here; they resurface in the step that needs the module.
+        """
+        pipeline, _ = _pipeline_ctx.get()
+        names = ("llm_client",) + self._PIPELINE_COMPONENTS[pipeline]
+        module_paths = {self._REGISTRY[name][0] for name in names if name not in self._instances}
+        await asyncio.gather(
+            *(asyncio.to_thread(_import_module, path) for path in module_paths),
+            return_exceptions=True,
+        )
+
+    _get_llm_client = functools.partialmethod(_get, "llm_client")
+    _get_technical_auditor = functools.partialmethod(_get, "technical_auditor")
+    _get_onpage_optimizer = functools.partialmethod(_get, "onpage_optimizer")
+    _get_schema_generator = functools.partialmethod(_get, "schema_generator")
+    _get_keyword_researcher = functools.partialmethod(_get, "keyword_researcher")
+    _get_keyword_analyzer = functools.partialmethod(_get, "keyword_analyzer")
+    _get_topical_researcher = functools.partialmethod(_get, "topical_researcher")
+    _get_blog_writer = functools.partialmethod(_get, "blog_writer")
+    _get_quality_checker = functools.partialmethod(_get, "quality_checker")
+    _get_content_manager = functools.partialmethod(_get, "content_manager")
+    _get_link_prospector = functools.partialmethod(_get, "link_prospector")
+    _get_outreach_manager = functools.partialmethod(_get, "outreach_manager")
+    _get_backlink_monitor = functools.partialmethod(_get, "backlink_monitor")
+    _get_rank_tracker = functools.partialmethod(_get, "rank_tracker")
+    _get_serp_analyzer = functools.partialmethod(_get, "serp_analyzer")
+    _get_local_seo_analyzer = functools.partialmethod(_get, "local_seo_analyzer")
+    _get_local_report_generator = functools.partialmethod(_get, "local_report_generator")
+    _get_citation_checker = functools.partialmethod(_get, "citation_checker")
+    _get_report_engine = functools.partialmethod(_get, "report_engine")
+    _get_report_renderer = functools.partialmethod(_get, "report_renderer")
+    _get_seo_news_scraper = functools.partialmethod(_get, "seo_news_scraper")
+
+    # ------------------------------------------------------------------
+    # Concurrency limiting
+    # ------------------------------------------------------------------
+
+    async def _bounded(self, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``factory()`` while holding one of ``max_parallel`` slots.
+
+        Every outbound module call (LLM, SERP, crawl) goes through here, so
+        the steps and fan-outs of all pipelines running on this engine
+        share one cap. Steps themselves are not bounded, so a step can
+        never hold a slot its own sub-calls are waiting for. The semaphore
+        is created on first use in each event loop it runs in. The call
+        is only made once a slot is held, so a caller cancelled while
+        queued leaves no un-awaited coroutine behind.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.BoundedSemaphore(self._max_parallel)
+            self._semaphore_loop = loop
+        async with self._semaphore:
+            return await factory()
+
+    # ------------------------------------------------------------------
+    # Research result cache
+    # ------------------------------------------------------------------
+
+    async def _cached(self, name: str, keyword: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return ``await factory()``, memoised per *name* and *keyword*.
+
+        For read-only lookups such as SERP analysis or topical maps, which
+        content batches repeat for the same keywords. Results live for
+        ``_RESEARCH_TTL`` seconds in an LRU of ``_RESEARCH_CACHE_SIZE``
+        entries; concurrent callers for the same key share one in-flight
+        call. Failures are not cached.
+        """
+        key = (name, keyword.lower().strip())
+        hit = self._research_cache.get(key)
+        if hit is not None:
+            if time.monotonic() - hit[0] < self._RESEARCH_TTL:
+                self._research_cache.move_to_end(key)
+                return hit[1]
+            del self._research_cache[key]
+        future = self._research_inflight.get(key)
+        if future is None:
+            future = self._research_inflight[key] = asyncio.ensure_future(factory())
+            future.add_done_callback(functools.partial(self._store_research, key))
+        # Shielded so one cancelled caller does not cancel the shared call
+        return await asyncio.shield(future)
+
+    def _store_research(self, key: tuple[str, str], future: asyncio.Future) -> None:
+        """Done-callback of a ``_cached`` call: keep its result if it succeeded."""
+        del self._research_inflight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._research_cache[key] = (time.monotonic(), future.result())
+        if len(self._research_cache) > self._RESEARCH_CACHE_SIZE:
+            self._research_cache.popitem(last=False)
 
     # ------------------------------------------------------------------
     # Logging helper
     # ------------------------------------------------------------------
 
-    def _log_step(
+    def _log_step(self, step: int, description: str, status: str = "running") -> None:
+        """Log and record a step transition of the current pipeline."""
+        pipeline, total = _pipeline_ctx.get()
+        # Lazy %-formatting: nothing is built when the level is filtered out
+        logger.log(
+            logging.ERROR if status in ("error", "timeout") else logging.INFO,
+            "[%s] Step %d/%d: %s — %s", pipeline, step, total, description, status,
+        )
+        # One status dict per pipeline, updated in place; get_pipeline_status()
+        # copies it and turns the raw timestamp into an ISO string
+        entry = self._pipeline_status.get(pipeline)
+        if entry is None:
+            entry = self._pipeline_status[pipeline] = {"current_step": step, "total_steps": total}
+        entry["current_step"] = step
+        entry["description"] = description
+        entry["status"] = status
+        entry["updated_at_ts"] = time.time()
+        entry.pop("elapsed_ms", None)
+
+    async def _run_step(
         self,
-        pipeline: str,
         step: int,
-        total: int,
         description: str,
-        status: str = "running",
-    ) -> None:
-        """Log and record a pipeline step transition."""
-        msg = f"[{pipeline}] Step {step}/{total}: {description} — {status}"
-        if status == "error":
-            logger.error(msg)
+        factory: Callable[[], Awaitable[dict[str, Any]]],
+        key: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Run one step of the current pipeline and return its result entry.
+
+        ``factory`` returns the step's payload, merged into a ``success``
+        entry (it may set its own ``status``, e.g. ``skipped``). A failure
+        is caught and recorded so that concurrent siblings and later steps
+        still run, and so is a step outliving *timeout* seconds, which is
+        cancelled; without a timeout the step runs to completion. *key*
+        names the step for the step sink (default: the factory's name).
+        The step's wall time lands in the pipeline status.
+        """
+        self._log_step(step, description)
+        t0 = time.perf_counter()
+        try:
+            data = await asyncio.wait_for(factory(), timeout)
+        except asyncio.TimeoutError:
+            logger.error("%s timed out after %.0fs", description, timeout)
+            self._log_step(step, description, "timeout")
+            entry = {"status": "timeout", "error": f"Timed out after {timeout:.0f}s"}
+        except Exception as exc:
+            # Tracebacks only at DEBUG; formatting one per expected failure is costly
+            logger.error("%s failed: %s", description, exc, exc_info=logger.isEnabledFor(logging.DEBUG))
+            self._log_step(step, description, "error")
+            entry = {"status": "error", "error": str(exc)}
         else:
-            logger.info(msg)
-        self._pipeline_status[pipeline] = {
-            "current_step": step,
-            "total_steps": total,
-            "description": description,
-            "status": status,
-            "updated_at": datetime.utcnow().isoformat(),
-        }
+            self._log_step(step, description, "done")
+            entry = {"status": "success", **data}
+        pipeline = _pipeline_ctx.get()[0]
+        self._pipeline_status[pipeline]["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        if self._step_sink is not None:
+            write = asyncio.ensure_future(self._persist_step(pipeline, key or factory.__name__, entry))
+            pending = self._pending_writes.setdefault(pipeline, set())
+            pending.add(write)
+            write.add_done_callback(pending.discard)
+        return entry
+
+    async def _persist_step(self, pipeline: str, key: str, entry: dict[str, Any]) -> None:
+        """Hand one step entry to the step sink off the event loop."""
+        try:
+            await asyncio.to_thread(self._step_sink, pipeline, key, entry)
+        except Exception as exc:
+            logger.warning("Persisting %s/%s failed: %s", pipeline, key, exc)
+
+    async def _run_dag(self, dag: Sequence[_Step], steps: dict[str, Any]) -> None:
+        """Run the step graph *dag*, storing each entry in *steps* by key.
+
+        Kahn-style scheduling without layer barriers: each step starts as
+        soon as its own dependencies have finished, alongside whatever else
+        is running. A failed dependency does not hold back its dependants:
+        they run and see whatever the failed step left in *steps*, as the
+        sequential pipelines always did. *steps* ends up in step order.
+        """
+        waiting = {node.key: set(node.deps) for node in dag}
+        unknown = set().union(*waiting.values()) - waiting.keys()
+        if unknown:
+            raise ValueError(f"Unknown step dependencies: {sorted(unknown)}")
+        nodes = {node.key: node for node in dag}
+        dependants = collections.defaultdict(list)
+        for node in dag:
+            for dep in node.deps:
+                dependants[dep].append(node.key)
+
+        running: dict[asyncio.Future, str] = {}
+
+        def start(key: str) -> None:
+            node = nodes[key]
+            running[asyncio.ensure_future(
+                self._run_step(node.index, node.description, node.run, key, node.timeout)
+            )] = key
+
+        for key, deps in waiting.items():
+            if not deps:
+                start(key)
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key = running.pop(task)
+                    steps[key] = task.result()
+                    for dependant in dependants[key]:
+                        waiting[dependant].discard(key)
+                        if not waiting[dependant]:
+                            start(dependant)
+        finally:
+            for task in running:
+                task.cancel()
+        stalled = [key for key in nodes if key not in steps]
+        if stalled:
+            raise ValueError(f"Cyclic step dependencies: {stalled}")
+        ordered = {node.key: steps.pop(node.key) for node in sorted(dag, key=lambda node: node.index)}
+        steps.update(ordered)
+
+    async def _finish(self, results: dict[str, Any], started: float, label: str) -> dict[str, Any]:
+        """Stamp timing and the success summary onto a pipeline's results.
+
+        Step writes the current pipeline still has queued for the step
+        sink are awaited first, so it only returns once everything it
+        produced is stored; other pipelines' writes are not waited on.
+        """
+        pending = self._pending_writes.get(_pipeline_ctx.get()[0])
+        if pending:
+            await asyncio.gather(*pending)
+        elapsed = time.perf_counter() - started
+        results["elapsed_seconds"] = round(elapsed, 2)
+        results["completed_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        step_entries = results["steps"].values()
+        success_count = sum(entry.get("status") == "success" for entry in step_entries)
+        results["summary"] = f"{success_count}/{len(step_entries)} steps succeeded in {elapsed:.1f}s"
+        logger.info("%s pipeline completed: %s", label, results["summary"])
+        return results
 
     # ------------------------------------------------------------------
     # Pipeline status
@@ -222,12 +470,19 @@ class WorkflowEngine:
 
     def get_pipeline_status(self) -> dict[str, Any]:
         """Return status of all pipelines that have been run."""
-        return dict(self._pipeline_status)
+        status = {}
+        for pipeline, entry in self._pipeline_status.items():
+            entry = dict(entry)
+            ts = entry.pop("updated_at_ts")
+            entry["updated_at"] = datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="seconds")
+            status[pipeline] = entry
+        return status
 
     # ------------------------------------------------------------------
     # 1. Full SEO Pipeline (9 steps)
     # ------------------------------------------------------------------
 
+    @_in_pipeline("full_seo", 9)
     async def run_full_seo_pipeline(
         self,
         domain: str,
@@ -235,7 +490,10 @@ class WorkflowEngine:
         business_name: Optional[str] = None,
         location: Optional[str] = None,
     ) -> dict[str, Any]:
-        """Master pipeline running all SEO modules in sequence.
+        """Master pipeline running all SEO modules.
+
+        Collects the entries yielded by ``stream_full_seo_pipeline`` into a
+        single results dict, with ``steps`` in step order.
 
         Steps:
             1. Technical audit
@@ -248,154 +506,128 @@ class WorkflowEngine:
             8. Local SEO (if business_name provided)
             9. Report generation
         """
-        pipeline = "full_seo"
-        total = 9
-        results: dict[str, Any] = {"domain": domain, "keywords": keywords, "steps": {}}
-        started = time.time()
+        results: dict[str, Any] = {"domain": domain, "keywords": keywords, "url": normalize_url(domain)}
+        started = time.perf_counter()
+        collected = [
+            item async for item in self.stream_full_seo_pipeline(domain, keywords, business_name, location)
+        ]
+        collected.sort(key=lambda item: item["index"])
+        results["steps"] = {item["step"]: item["result"] for item in collected}
+
+        return await self._finish(results, started, "Full SEO")
+
+    @_in_pipeline("full_seo", 9)
+    async def stream_full_seo_pipeline(
+        self,
+        domain: str,
+        keywords: list[str],
+        business_name: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Run the full SEO pipeline, yielding each step as it finishes.
+
+        Yields ``{"step": key, "index": n, "result": entry}`` dicts. Steps
+        1-8 only need the inputs and run concurrently, so they arrive in
+        completion order; the report (step 9) comes last. Nothing is kept
+        once yielded, so a caller that persists each entry only ever holds
+        one step's payload.
+        """
         logger.info("Starting full SEO pipeline for %s with %d keywords", domain, len(keywords))
+        await self._preload()
 
-        # Step 1: Technical Audit
-        self._log_step(pipeline, 1, total, "Technical audit")
-        try:
+        url = normalize_url(domain)
+        first_kw = keywords[0] if keywords else domain
+
+        async def technical_audit() -> dict[str, Any]:
             auditor = self._get_technical_auditor()
-            url = domain if domain.startswith("http") else f"https://{domain}"
-            audit_data = await auditor.run_full_audit(url)
-            score_data = auditor.score_audit(audit_data)
-            results["steps"]["technical_audit"] = {"status": "success", "data": audit_data, "score": score_data}
-            self._log_step(pipeline, 1, total, "Technical audit", "done")
-        except Exception as exc:
-            logger.exception("Technical audit failed: %s", exc)
-            results["steps"]["technical_audit"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 1, total, "Technical audit", "error")
+            audit_data = await self._bounded(lambda: auditor.run_full_audit(url))
+            return {"data": audit_data, "score": auditor.score_audit(audit_data)}
 
-        # Step 2: On-page analysis
-        self._log_step(pipeline, 2, total, "On-page analysis")
-        try:
-            optimizer = self._get_onpage_optimizer()
-            url = domain if domain.startswith("http") else f"https://{domain}"
-            onpage_data = await optimizer.analyze_page(url)
-            results["steps"]["onpage_analysis"] = {"status": "success", "data": onpage_data}
-            self._log_step(pipeline, 2, total, "On-page analysis", "done")
-        except Exception as exc:
-            logger.exception("On-page analysis failed: %s", exc)
-            results["steps"]["onpage_analysis"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 2, total, "On-page analysis", "error")
+        async def onpage_analysis() -> dict[str, Any]:
+            return {"data": await self._bounded(lambda: self._get_onpage_optimizer().analyze_page(url))}
 
-        # Step 3: Keyword research
-        self._log_step(pipeline, 3, total, "Keyword research")
-        try:
+        async def keyword_research() -> dict[str, Any]:
             researcher = self._get_keyword_researcher()
-            kw_data = await researcher.full_research_pipeline(keywords)
-            results["steps"]["keyword_research"] = {"status": "success", "data": kw_data}
-            self._log_step(pipeline, 3, total, "Keyword research", "done")
-        except Exception as exc:
-            logger.exception("Keyword research failed: %s", exc)
-            results["steps"]["keyword_research"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 3, total, "Keyword research", "error")
+            return {"data": await self._bounded(lambda: researcher.full_research_pipeline(keywords))}
 
-        # Step 4: Topical research
-        self._log_step(pipeline, 4, total, "Topical research")
-        try:
+        async def topical_research() -> dict[str, Any]:
             topical = self._get_topical_researcher()
-            niche = keywords[0] if keywords else domain
-            topical_map = await topical.generate_topical_map(niche)
-            results["steps"]["topical_research"] = {"status": "success", "data": topical_map}
-            self._log_step(pipeline, 4, total, "Topical research", "done")
-        except Exception as exc:
-            logger.exception("Topical research failed: %s", exc)
-            results["steps"]["topical_research"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 4, total, "Topical research", "error")
+            return {"data": await self._cached(
+                "topical_map", first_kw, lambda: self._bounded(lambda: topical.generate_topical_map(first_kw)))}
 
-        # Step 5: Content generation
-        self._log_step(pipeline, 5, total, "Content generation")
-        try:
+        async def content_generation() -> dict[str, Any]:
             writer = self._get_blog_writer()
-            target_kw = keywords[0] if keywords else domain
-            brief = await writer.generate_brief(target_kw, "blog_post")
-            article = await writer.write_article(brief)
-            checker = self._get_quality_checker()
-            quality = checker.check_quality(article, target_kw)
-            results["steps"]["content_generation"] = {
-                "status": "success",
-                "brief": brief,
-                "article": article,
-                "quality": quality,
-            }
-            self._log_step(pipeline, 5, total, "Content generation", "done")
-        except Exception as exc:
-            logger.exception("Content generation failed: %s", exc)
-            results["steps"]["content_generation"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 5, total, "Content generation", "error")
+            brief = await self._bounded(lambda: writer.generate_brief(first_kw, "blog_post"))
+            article = await self._bounded(lambda: writer.write_article(brief))
+            quality = self._get_quality_checker().check_quality(article, first_kw)
+            return {"brief": brief, "article": article, "quality": quality}
 
-        # Step 6: Link building prospecting
-        self._log_step(pipeline, 6, total, "Link building")
-        try:
+        async def link_building() -> dict[str, Any]:
             prospector = self._get_link_prospector()
-            prospects = await prospector.find_prospects(domain, keywords)
-            results["steps"]["link_building"] = {"status": "success", "prospects": prospects}
-            self._log_step(pipeline, 6, total, "Link building", "done")
-        except Exception as exc:
-            logger.exception("Link building failed: %s", exc)
-            results["steps"]["link_building"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 6, total, "Link building", "error")
+            return {"prospects": await self._bounded(lambda: prospector.find_prospects(domain, keywords))}
 
-        # Step 7: Rank tracking
-        self._log_step(pipeline, 7, total, "Rank tracking")
-        try:
+        async def rank_tracking() -> dict[str, Any]:
             tracker = self._get_rank_tracker()
-            rank_results = await tracker.track_keywords_bulk(domain, keywords)
-            results["steps"]["rank_tracking"] = {"status": "success", "data": rank_results}
-            self._log_step(pipeline, 7, total, "Rank tracking", "done")
-        except Exception as exc:
-            logger.exception("Rank tracking failed: %s", exc)
-            results["steps"]["rank_tracking"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 7, total, "Rank tracking", "error")
-
-        # Step 8: Local SEO (optional)
-        self._log_step(pipeline, 8, total, "Local SEO")
+            return {"data": await self._bounded(lambda: tracker.track_keywords_bulk(domain, keywords))}
+
+        async def local_seo() -> dict[str, Any]:
+            local_analyzer = self._get_local_seo_analyzer()
+            return {"data": await self._bounded(
+                lambda: local_analyzer.analyze_business(url, business_name, location)
+            )}
+
+        async def keyed(
+            key: str,
+            step: int,
+            description: str,
+            factory: Callable[[], Awaitable[dict[str, Any]]],
+            timeout: Optional[float] = None,
+        ) -> dict[str, Any]:
+            entry = await self._run_step(step, description, factory, key, timeout)
+            return {"step": key, "index": step, "result": entry}
+
+        # Steps 1-8 only depend on the inputs, so they run concurrently
+        independent = [
+            ("technical_audit", 1, "Technical audit", technical_audit),
+            ("onpage_analysis", 2, "On-page analysis", onpage_analysis),
+            ("keyword_research", 3, "Keyword research", keyword_research),
+            ("topical_research", 4, "Topical research", topical_research),
+            ("content_generation", 5, "Content generation", content_generation,
+             self._LLM_STEP_TIMEOUT),
+            ("link_building", 6, "Link building", link_building),
+            ("rank_tracking", 7, "Rank tracking", rank_tracking),
+        ]
         if business_name and location:
-            try:
-                local_analyzer = self._get_local_seo_analyzer()
-                url = domain if domain.startswith("http") else f"https://{domain}"
-                local_data = await local_analyzer.analyze_business(url, business_name, location)
-                results["steps"]["local_seo"] = {"status": "success", "data": local_data}
-                self._log_step(pipeline, 8, total, "Local SEO", "done")
-            except Exception as exc:
-                logger.exception("Local SEO failed: %s", exc)
-                results["steps"]["local_seo"] = {"status": "error", "error": str(exc)}
-                self._log_step(pipeline, 8, total, "Local SEO", "error")
+            independent.append(("local_seo", 8, "Local SEO", local_seo))
         else:
-            results["steps"]["local_seo"] = {"status": "skipped", "reason": "No business_name/location provided"}
-            self._log_step(pipeline, 8, total, "Local SEO", "skipped")
-
-        # Step 9: Report generation
-        self._log_step(pipeline, 9, total, "Report generation")
+            self._log_step(8, "Local SEO", "skipped")
+            yield {
+                "step": "local_seo",
+                "index": 8,
+                "result": {"status": "skipped", "reason": "No business_name/location provided"},
+            }
+        tasks = [asyncio.ensure_future(keyed(*spec)) for spec in independent]
         try:
-            report_engine = self._get_report_engine()
-            report_data = await report_engine.generate_full_report(domain)
-            renderer = self._get_report_renderer()
-            html_path = renderer.render_html(report_data)
-            results["steps"]["report"] = {"status": "success", "data": report_data, "html_path": html_path}
-            self._log_step(pipeline, 9, total, "Report generation", "done")
-        except Exception as exc:
-            logger.exception("Report generation failed: %s", exc)
-            results["steps"]["report"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 9, total, "Report generation", "error")
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer may stop early; do not leave steps running
+            for task in tasks:
+                task.cancel()
 
-        elapsed = time.time() - started
-        results["elapsed_seconds"] = round(elapsed, 2)
-        results["completed_at"] = datetime.utcnow().isoformat()
-        step_statuses = [v.get("status", "unknown") for v in results["steps"].values()]
-        success_count = step_statuses.count("success")
-        total_count = len(step_statuses)
-        results["summary"] = f"{success_count}/{total_count} steps succeeded in {elapsed:.1f}s"
-        logger.info("Full SEO pipeline completed: %s", results["summary"])
-        return results
+        # Step 9: Report generation (reads what the earlier steps stored)
+        async def report() -> dict[str, Any]:
+            report_data = await self._bounded(lambda: self._get_report_engine().generate_full_report(domain))
+            html_path = self._get_report_renderer().render_html(report_data)
+            return {"data": report_data, "html_path": html_path}
+
+        yield await keyed("report", 9, "Report generation", report)
 
     # ------------------------------------------------------------------
     # 2. Content Pipeline (7 steps)
     # ------------------------------------------------------------------
 
+    @_in_pipeline("content", 7)
     async def run_content_pipeline(
         self,
         domain: str,
@@ -413,126 +645,91 @@ class WorkflowEngine:
             6. Quality check
             7. Schema generation
         """
-        pipeline = "content"
-        total = 7
-        results: dict[str, Any] = {"domain": domain, "keyword": keyword, "steps": {}}
-        started = time.time()
+        steps: dict[str, Any] = {}
+        results: dict[str, Any] = {"domain": domain, "keyword": keyword, "steps": steps}
+        started = time.perf_counter()
         logger.info("Starting content pipeline for keyword: %s", keyword)
+        await self._preload()
 
-        # Step 1: Keyword expansion
-        self._log_step(pipeline, 1, total, "Keyword expansion")
-        try:
+        async def keyword_expansion() -> dict[str, Any]:
             researcher = self._get_keyword_researcher()
-            expanded = await researcher.expand_keywords([keyword])
-            intent_data = await researcher.classify_intent([keyword] + expanded.get("keywords", [])[:10])
-            results["steps"]["keyword_expansion"] = {"status": "success", "expanded": expanded, "intent": intent_data}
-            self._log_step(pipeline, 1, total, "Keyword expansion", "done")
-        except Exception as exc:
-            logger.exception("Keyword expansion failed: %s", exc)
-            results["steps"]["keyword_expansion"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 1, total, "Keyword expansion", "error")
+            expanded = await self._bounded(lambda: researcher.expand_keywords([keyword]))
+            related = [keyword] + expanded.get("keywords", [])[:10]
+            intent_data = await self._bounded(lambda: researcher.classify_intent(related))
+            return {"expanded": expanded, "intent": intent_data}
 
-        # Step 2: SERP analysis
-        self._log_step(pipeline, 2, total, "SERP analysis")
-        try:
+        async def serp_analysis() -> dict[str, Any]:
             researcher = self._get_keyword_researcher()
-            serp_data = await researcher.analyze_serp(keyword)
-            results["steps"]["serp_analysis"] = {"status": "success", "data": serp_data}
-            self._log_step(pipeline, 2, total, "SERP analysis", "done")
-        except Exception as exc:
-            logger.exception("SERP analysis failed: %s", exc)
-            results["steps"]["serp_analysis"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 2, total, "SERP analysis", "error")
+            return {"data": await self._cached(
+                "serp", keyword, lambda: self._bounded(lambda: researcher.analyze_serp(keyword)))}
 
-        # Step 3: Topical map and content gaps
-        self._log_step(pipeline, 3, total, "Topical mapping")
-        try:
+        async def topical_mapping() -> dict[str, Any]:
             topical = self._get_topical_researcher()
-            topical_map = await topical.generate_topical_map(keyword)
-            content_gaps = await topical.find_content_gaps(keyword)
-            results["steps"]["topical_mapping"] = {"status": "success", "map": topical_map, "gaps": content_gaps}
-            self._log_step(pipeline, 3, total, "Topical mapping", "done")
-        except Exception as exc:
-            logger.exception("Topical mapping failed: %s", exc)
-            results["steps"]["topical_mapping"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 3, total, "Topical mapping", "error")
+            topical_map, content_gaps = await asyncio.gather(
+                self._cached("topical_map", keyword, lambda: self._bounded(
+                    lambda: topical.generate_topical_map(keyword))),
+                self._cached("content_gaps", keyword, lambda: self._bounded(
+                    lambda: topical.find_content_gaps(keyword))),
+            )
+            return {"map": topical_map, "gaps": content_gaps}
 
-        # Step 4: Content brief
-        self._log_step(pipeline, 4, total, "Content brief")
-        try:
-            writer = self._get_blog_writer()
-            brief = await writer.generate_brief(keyword, content_type)
-            results["steps"]["content_brief"] = {"status": "success", "brief": brief}
-            self._log_step(pipeline, 4, total, "Content brief", "done")
-        except Exception as exc:
-            logger.exception("Content brief failed: %s", exc)
-            results["steps"]["content_brief"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 4, total, "Content brief", "error")
+        async def content_brief() -> dict[str, Any]:
+            return {"brief": await self._bounded(
+                lambda: self._get_blog_writer().generate_brief(keyword, content_type)
+            )}
 
-        # Step 5: Article writing
-        self._log_step(pipeline, 5, total, "Article writing")
-        try:
+        async def article_writing() -> dict[str, Any]:
             writer = self._get_blog_writer()
-            brief_data = results["steps"].get("content_brief", {}).get("brief", {})
+            brief_data = steps["content_brief"].get("brief")
             if not brief_data:
-                brief_data = await writer.generate_brief(keyword, content_type)
-            article = await writer.write_article(brief_data)
-            results["steps"]["article_writing"] = {"status": "success", "article": article}
-            self._log_step(pipeline, 5, total, "Article writing", "done")
-        except Exception as exc:
-            logger.exception("Article writing failed: %s", exc)
-            results["steps"]["article_writing"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 5, total, "Article writing", "error")
+                brief_data = await self._bounded(lambda: writer.generate_brief(keyword, content_type))
+            return {"article": await self._bounded(lambda: writer.write_article(brief_data))}
 
-        # Step 6: Quality check
-        self._log_step(pipeline, 6, total, "Quality check")
-        try:
+        async def quality_check() -> dict[str, Any]:
             checker = self._get_quality_checker()
-            article_data = results["steps"].get("article_writing", {}).get("article", {})
-            if article_data:
-                quality = checker.check_quality(article_data, keyword)
-                results["steps"]["quality_check"] = {"status": "success", "quality": quality}
-            else:
-                results["steps"]["quality_check"] = {"status": "skipped", "reason": "No article to check"}
-            self._log_step(pipeline, 6, total, "Quality check", "done")
-        except Exception as exc:
-            logger.exception("Quality check failed: %s", exc)
-            results["steps"]["quality_check"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 6, total, "Quality check", "error")
+            article_data = steps["article_writing"].get("article")
+            if not article_data:
+                return {"status": "skipped", "reason": "No article to check"}
+            return {"quality": checker.check_quality(article_data, keyword)}
 
-        # Step 7: Schema generation
-        self._log_step(pipeline, 7, total, "Schema generation")
-        try:
+        base_url = normalize_url(domain).rstrip("/")
+
+        async def schema() -> dict[str, Any]:
             schema_gen = self._get_schema_generator()
-            article_data = results["steps"].get("article_writing", {}).get("article", {})
+            article_data = steps["article_writing"].get("article")
             title = article_data.get("title", keyword) if isinstance(article_data, dict) else keyword
             schema = schema_gen.generate_article_schema(
                 title=title,
                 description=article_data.get("meta_description", "") if isinstance(article_data, dict) else "",
-                url=f"https://{domain}/blog/{keyword.replace(' ', '-')}",
+                url=f"{base_url}/blog/{keyword.replace(' ', '-')}",
             )
-            validation = schema_gen.validate_schema(schema)
-            results["steps"]["schema"] = {"status": "success", "schema": schema, "validation": validation}
-            self._log_step(pipeline, 7, total, "Schema generation", "done")
-        except Exception as exc:
-            logger.exception("Schema generation failed: %s", exc)
-            results["steps"]["schema"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 7, total, "Schema generation", "error")
-
-        elapsed = time.time() - started
-        results["elapsed_seconds"] = round(elapsed, 2)
-        results["completed_at"] = datetime.utcnow().isoformat()
-        step_statuses = [v.get("status", "unknown") for v in results["steps"].values()]
-        success_count = step_statuses.count("success")
-        total_count = len(step_statuses)
-        results["summary"] = f"{success_count}/{total_count} steps succeeded in {elapsed:.1f}s"
-        logger.info("Content pipeline completed: %s", results["summary"])
-        return results
+            return {"schema": schema, "validation": schema_gen.validate_schema(schema)}
+
+        # Research and the brief only need the keyword; the article needs
+        # the brief, and both checks need the article
+        await self._run_dag((
+            _Step("keyword_expansion", 1, "Keyword expansion", keyword_expansion),
+            _Step("serp_analysis", 2, "SERP analysis", serp_analysis),
+            _Step("topical_mapping", 3, "Topical mapping", topical_mapping),
+            _Step(
+                "content_brief", 4, "Content brief", content_brief,
+                timeout=self._LLM_STEP_TIMEOUT,
+            ),
+            _Step(
+                "article_writing", 5, "Article writing", article_writing, ("content_brief",),
+                timeout=self._LLM_STEP_TIMEOUT,
+            ),
+            _Step("quality_check", 6, "Quality check", quality_check, ("article_writing",)),
+            _Step("schema", 7, "Schema generation", schema, ("article_writing",)),
+        ), steps)
+
+        return await self._finish(results, started, "Content")
 
     # ------------------------------------------------------------------
     # 3. Link Building Pipeline (5 steps)
     # ------------------------------------------------------------------
 
+    @_in_pipeline("link_building", 5)
     async def run_link_building_pipeline(
         self,
         domain: str,
@@ -548,126 +745,112 @@ class WorkflowEngine:
             4. Prospect scoring
             5. Outreach email generation
         """
-        pipeline = "link_building"
-        total = 5
-        results: dict[str, Any] = {"domain": domain, "keywords": keywords, "steps": {}}
-        started = time.time()
+        steps: dict[str, Any] = {}
+        results: dict[str, Any] = {"domain": domain, "keywords": keywords, "steps": steps}
+        started = time.perf_counter()
         logger.info("Starting link building pipeline for %s", domain)
+        await self._preload()
 
-        # Step 1: Backlink profile analysis
-        self._log_step(pipeline, 1, total, "Backlink profile analysis")
-        try:
-            monitor = self._get_backlink_monitor()
-            profile = await monitor.analyze_backlink_profile(domain)
-            results["steps"]["backlink_profile"] = {"status": "success", "data": profile}
-            self._log_step(pipeline, 1, total, "Backlink profile analysis", "done")
-        except Exception as exc:
-            logger.exception("Backlink profile analysis failed: %s", exc)
-            results["steps"]["backlink_profile"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 1, total, "Backlink profile analysis", "error")
+        business_info = {"domain": domain, "name": domain.replace(".", " ").title()}
 
-        # Step 2: Competitor backlinks
-        self._log_step(pipeline, 2, total, "Competitor backlink discovery")
-        try:
+        async def backlink_profile() -> dict[str, Any]:
+            return {"data": await self._bounded(
+                lambda: self._get_backlink_monitor().analyze_backlink_profile(domain)
+            )}
+
+        async def competitor_backlinks() -> dict[str, Any]:
             prospector = self._get_link_prospector()
             comp_list = competitors or []
+            found = await asyncio.gather(
+                *(
+                    self._bounded(functools.partial(prospector.find_competitor_backlinks, comp))
+                    for comp in comp_list
+                ),
+                return_exceptions=True,
+            )
             comp_backlinks = []
-            for comp in comp_list:
-                try:
-                    comp_links = await prospector.find_competitor_backlinks(comp)
+            for comp, comp_links in zip(comp_list, found):
+                if isinstance(comp_links, Exception):
+                    logger.warning("Competitor backlink check failed for %s: %s", comp, comp_links)
+                    comp_backlinks.append({"competitor": comp, "error": str(comp_links)})
+                else:
                     comp_backlinks.append({"competitor": comp, "backlinks": comp_links})
-                except Exception as inner_exc:
-                    logger.warning("Competitor backlink check failed for %s: %s", comp, inner_exc)
-                    comp_backlinks.append({"competitor": comp, "error": str(inner_exc)})
-            results["steps"]["competitor_backlinks"] = {"status": "success", "data": comp_backlinks}
-            self._log_step(pipeline, 2, total, "Competitor backlink discovery", "done")
-        except Exception as exc:
-            logger.exception("Competitor backlink discovery failed: %s", exc)
-            results["steps"]["competitor_backlinks"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 2, total, "Competitor backlink discovery", "error")
+            return {"data": comp_backlinks}
 
-        # Step 3: Link prospecting
-        self._log_step(pipeline, 3, total, "Link prospecting")
-        try:
+        async def link_prospecting() -> dict[str, Any]:
             prospector = self._get_link_prospector()
+            found = await asyncio.gather(
+                self._bounded(lambda: prospector.find_guest_post_opportunities(domain, keywords)),
+                self._bounded(lambda: prospector.find_resource_page_links(domain, keywords)),
+                self._bounded(lambda: prospector.find_broken_link_opportunities(domain)),
+                return_exceptions=True,
+            )
             all_prospects = []
-            try:
-                guest_posts = await prospector.find_guest_post_opportunities(domain, keywords)
-                all_prospects.extend(guest_posts if isinstance(guest_posts, list) else [])
-            except Exception as gp_exc:
-                logger.warning("Guest post prospecting failed: %s", gp_exc)
-            try:
-                resource_pages = await prospector.find_resource_page_links(domain, keywords)
-                all_prospects.extend(resource_pages if isinstance(resource_pages, list) else [])
-            except Exception as rp_exc:
-                logger.warning("Resource page prospecting failed: %s", rp_exc)
-            try:
-                broken_links = await prospector.find_broken_link_opportunities(domain)
-                all_prospects.extend(broken_links if isinstance(broken_links, list) else [])
-            except Exception as bl_exc:
-                logger.warning("Broken link prospecting failed: %s", bl_exc)
-            results["steps"]["link_prospecting"] = {"status": "success", "prospects": all_prospects, "count": len(all_prospects)}
-            self._log_step(pipeline, 3, total, "Link prospecting", "done")
-        except Exception as exc:
-            logger.exception("Link prospecting failed: %s", exc)
-            results["steps"]["link_prospecting"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 3, total, "Link prospecting", "error")
-
-        # Step 4: Prospect scoring
-        self._log_step(pipeline, 4, total, "Prospect scoring")
-        try:
+            for kind, prospects in zip(("Guest post", "Resource page", "Broken link"), found):
+                if isinstance(prospects, Exception):
+                    logger.warning("%s prospecting failed: %s", kind, prospects)
+                elif isinstance(prospects, list):
+                    all_prospects.extend(prospects)
+            return {"prospects": all_prospects, "count": len(all_prospects)}
+
+        async def prospect_scoring() -> dict[str, Any]:
             prospector = self._get_link_prospector()
-            prospects_list = results["steps"].get("link_prospecting", {}).get("prospects", [])
-            scored = []
-            for prospect in prospects_list[:20]:
+            prospects_list = steps["link_prospecting"].get("prospects", ())
+
+            # Every entry is a dict with a "score" so the sort can use itemgetter
+            async def score(prospect: dict[str, Any]) -> dict[str, Any]:
                 try:
-                    score_result = await prospector.score_prospect(prospect)
-                    scored.append(score_result)
+                    return {**prospect, "score": await self._bounded(lambda: prospector.score_prospect(prospect))}
                 except Exception as score_exc:
                     logger.warning("Prospect scoring error: %s", score_exc)
-                    scored.append({"prospect": prospect, "score_error": str(score_exc)})
-            scored.sort(key=lambda x: x.get("score", 0) if isinstance(x, dict) else 0, reverse=True)
-            results["steps"]["prospect_scoring"] = {"status": "success", "scored_prospects": scored}
-            self._log_step(pipeline, 4, total, "Prospect scoring", "done")
-        except Exception as exc:
-            logger.exception("Prospect scoring failed: %s", exc)
-            results["steps"]["prospect_scoring"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 4, total, "Prospect scoring", "error")
+                    return {"prospect": prospect, "score": 0.0, "score_error": str(score_exc)}
 
-        # Step 5: Outreach email generation
-        self._log_step(pipeline, 5, total, "Outreach email generation")
-        try:
+            scored = list(await asyncio.gather(
+                *(score(prospect) for prospect in itertools.islice(prospects_list, 20))
+            ))
+            scored.sort(key=operator.itemgetter("score"), reverse=True)
+            return {"scored_prospects": scored}
+
+        async def outreach_emails() -> dict[str, Any]:
             outreach = self._get_outreach_manager()
-            scored_list = results["steps"].get("prospect_scoring", {}).get("scored_prospects", [])
-            business_info = {"domain": domain, "name": domain.replace(".", " ").title()}
+            scored_list = steps["prospect_scoring"].get("scored_prospects", ())
+            drafts = [
+                asyncio.ensure_future(
+                    self._bounded(functools.partial(
+                        outreach.generate_outreach_email, prospect, "guest_post", business_info
+                    ))
+                )
+                for prospect in itertools.islice(scored_list, 10)
+            ]
+            # Collected as they finish, so each draft is handled without
+            # waiting on the slowest LLM call
             emails = []
-            for prospect in scored_list[:10]:
-                try:
-                    email = await outreach.generate_outreach_email(prospect, "guest_post", business_info)
-                    emails.append(email)
-                except Exception as email_exc:
-                    logger.warning("Email generation error: %s", email_exc)
-            results["steps"]["outreach_emails"] = {"status": "success", "emails": emails, "count": len(emails)}
-            self._log_step(pipeline, 5, total, "Outreach email generation", "done")
-        except Exception as exc:
-            logger.exception("Outreach email generation failed: %s", exc)
-            results["steps"]["outreach_emails"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 5, total, "Outreach email generation", "error")
+            try:
+                for next_draft in asyncio.as_completed(drafts):
+                    try:
+                        emails.append(await next_draft)
+                    except Exception as email_exc:
+                        logger.warning("Email generation error: %s", email_exc)
+            finally:
+                for draft in drafts:
+                    draft.cancel()
+            return {"emails": emails, "count": len(emails)}
 
-        elapsed = time.time() - started
-        results["elapsed_seconds"] = round(elapsed, 2)
-        results["completed_at"] = datetime.utcnow().isoformat()
-        step_statuses = [v.get("status", "unknown") for v in results["steps"].values()]
-        success_count = step_statuses.count("success")
-        total_count = len(step_statuses)
-        results["summary"] = f"{success_count}/{total_count} steps succeeded in {elapsed:.1f}s"
-        logger.info("Link building pipeline completed: %s", results["summary"])
-        return results
+        await self._run_dag((
+            _Step("backlink_profile", 1, "Backlink profile analysis", backlink_profile),
+            _Step("competitor_backlinks", 2, "Competitor backlink discovery", competitor_backlinks),
+            _Step("link_prospecting", 3, "Link prospecting", link_prospecting),
+            _Step("prospect_scoring", 4, "Prospect scoring", prospect_scoring, ("link_prospecting",)),
+            _Step("outreach_emails", 5, "Outreach email generation", outreach_emails, ("prospect_scoring",)),
+        ), steps)
+
+        return await self._finish(results, started, "Link building")
 
     # ------------------------------------------------------------------
     # 4. Monitoring Pipeline (6 steps)
     # ------------------------------------------------------------------
 
+    @_in_pipeline("monitoring", 6)
     async def run_monitoring_pipeline(self, domain: str) -> dict[str, Any]:
         """Monitoring pipeline for ongoing SEO health checks.
 
@@ -679,100 +862,56 @@ class WorkflowEngine:
             5. SEO news scraping
             6. Summary report
         """
-        pipeline = "monitoring"
-        total = 6
-        results: dict[str, Any] = {"domain": domain, "steps": {}}
-        started = time.time()
+        steps: dict[str, Any] = {}
+        results: dict[str, Any] = {"domain": domain, "steps": steps}
+        started = time.perf_counter()
         logger.info("Starting monitoring pipeline for %s", domain)
+        await self._preload()
 
-        # Step 1: Backlink monitoring
-        self._log_step(pipeline, 1, total, "Backlink monitoring")
-        try:
-            monitor = self._get_backlink_monitor()
-            backlinks = await monitor.check_backlinks(domain)
-            results["steps"]["backlink_monitoring"] = {"status": "success", "data": backlinks}
-            self._log_step(pipeline, 1, total, "Backlink monitoring", "done")
-        except Exception as exc:
-            logger.exception("Backlink monitoring failed: %s", exc)
-            results["steps"]["backlink_monitoring"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 1, total, "Backlink monitoring", "error")
+        async def backlink_monitoring() -> dict[str, Any]:
+            return {"data": await self._bounded(lambda: self._get_backlink_monitor().check_backlinks(domain))}
 
-        # Step 2: Toxic link detection
-        self._log_step(pipeline, 2, total, "Toxic link detection")
-        try:
+        async def toxic_links() -> dict[str, Any]:
             monitor = self._get_backlink_monitor()
-            bl_data = results["steps"].get("backlink_monitoring", {}).get("data", {})
+            bl_data = steps["backlink_monitoring"].get("data")
             backlink_list = bl_data.get("backlinks", []) if isinstance(bl_data, dict) else []
-            toxic = await monitor.detect_toxic_links(backlink_list)
-            results["steps"]["toxic_links"] = {"status": "success", "data": toxic}
-            self._log_step(pipeline, 2, total, "Toxic link detection", "done")
-        except Exception as exc:
-            logger.exception("Toxic link detection failed: %s", exc)
-            results["steps"]["toxic_links"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 2, total, "Toxic link detection", "error")
+            return {"data": await self._bounded(lambda: monitor.detect_toxic_links(backlink_list))}
 
-        # Step 3: Rank change detection
-        self._log_step(pipeline, 3, total, "Rank change detection")
-        try:
-            tracker = self._get_rank_tracker()
-            changes = tracker.detect_ranking_changes(domain)
-            results["steps"]["rank_changes"] = {"status": "success", "data": changes}
-            self._log_step(pipeline, 3, total, "Rank change detection", "done")
-        except Exception as exc:
-            logger.exception("Rank change detection failed: %s", exc)
-            results["steps"]["rank_changes"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 3, total, "Rank change detection", "error")
+        async def rank_changes() -> dict[str, Any]:
+            # Synchronous DB query; run it off the loop so sibling steps progress
+            return {"data": await asyncio.to_thread(self._get_rank_tracker().detect_ranking_changes, domain)}
 
-        # Step 4: SERP feature analysis
-        self._log_step(pipeline, 4, total, "SERP feature analysis")
-        try:
-            analyzer = self._get_serp_analyzer()
-            serp_features = await analyzer.analyze_serp_features(domain)
-            results["steps"]["serp_features"] = {"status": "success", "data": serp_features}
-            self._log_step(pipeline, 4, total, "SERP feature analysis", "done")
-        except Exception as exc:
-            logger.exception("SERP feature analysis failed: %s", exc)
-            results["steps"]["serp_features"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 4, total, "SERP feature analysis", "error")
+        async def serp_features() -> dict[str, Any]:
+            return {"data": await self._bounded(lambda: self._get_serp_analyzer().analyze_serp_features(domain))}
 
-        # Step 5: SEO news scraping
-        self._log_step(pipeline, 5, total, "SEO news scraping")
-        try:
-            scraper = self._get_seo_news_scraper()
-            news = await scraper.scrape_all_sources()
-            results["steps"]["seo_news"] = {"status": "success", "articles": news, "count": len(news)}
-            self._log_step(pipeline, 5, total, "SEO news scraping", "done")
-        except Exception as exc:
-            logger.exception("SEO news scraping failed: %s", exc)
-            results["steps"]["seo_news"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 5, total, "SEO news scraping", "error")
+        async def seo_news() -> dict[str, Any]:
+            news = await self._bounded(lambda: self._get_seo_news_scraper().scrape_all_sources())
+            return {"articles": news, "count": len(news)}
 
-        # Step 6: Summary report
-        self._log_step(pipeline, 6, total, "Summary report")
-        try:
+        async def summary_report() -> dict[str, Any]:
             report_engine = self._get_report_engine()
-            summary = await report_engine.generate_executive_summary(results["steps"])
-            results["steps"]["summary_report"] = {"status": "success", "summary": summary}
-            self._log_step(pipeline, 6, total, "Summary report", "done")
-        except Exception as exc:
-            logger.exception("Summary report failed: %s", exc)
-            results["steps"]["summary_report"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 6, total, "Summary report", "error")
-
-        elapsed = time.time() - started
-        results["elapsed_seconds"] = round(elapsed, 2)
-        results["completed_at"] = datetime.utcnow().isoformat()
-        step_statuses = [v.get("status", "unknown") for v in results["steps"].values()]
-        success_count = step_statuses.count("success")
-        total_count = len(step_statuses)
-        results["summary"] = f"{success_count}/{total_count} steps succeeded in {elapsed:.1f}s"
-        logger.info("Monitoring pipeline completed: %s", results["summary"])
-        return results
+            return {"summary": await self._bounded(lambda: report_engine.generate_executive_summary(steps))}
+
+        # Only toxic-link detection needs an earlier check (the backlink
+        # list); the summary reads every other step
+        await self._run_dag((
+            _Step("backlink_monitoring", 1, "Backlink monitoring", backlink_monitoring),
+            _Step("toxic_links", 2, "Toxic link detection", toxic_links, ("backlink_monitoring",)),
+            _Step("rank_changes", 3, "Rank change detection", rank_changes),
+            _Step("serp_features", 4, "SERP feature analysis", serp_features),
+            _Step("seo_news", 5, "SEO news scraping", seo_news),
+            _Step("summary_report", 6, "Summary report", summary_report, (
+                "backlink_monitoring", "toxic_links", "rank_changes", "serp_features", "seo_news",
+            )),
+        ), steps)
+
+        return await self._finish(results, started, "Monitoring")
 
     # ------------------------------------------------------------------
     # 5. Local SEO Pipeline (6 steps)
     # ------------------------------------------------------------------
 
+    @_in_pipeline("local_seo", 6)
     async def run_local_seo_pipeline(
         self,
         domain: str,
@@ -789,114 +928,86 @@ class WorkflowEngine:
             5. Competitor analysis
             6. Local SEO report generation
         """
-        pipeline = "local_seo"
-        total = 6
+        steps: dict[str, Any] = {}
         results: dict[str, Any] = {
             "domain": domain,
             "business_name": business_name,
             "location": location,
-            "steps": {},
+            "steps": steps,
         }
-        started = time.time()
+        started = time.perf_counter()
         logger.info("Starting local SEO pipeline for %s (%s, %s)", domain, business_name, location)
+        await self._preload()
 
-        url = domain if domain.startswith("http") else f"https://{domain}"
+        url = results["url"] = normalize_url(domain)
+        domain_slug = domain.replace(".", "_")
+        local_keywords = [
+            f"{business_name} {location}",
+            f"{business_name} near me",
+            f"best {business_name} {location}",
+        ]
 
-        # Step 1: Business analysis
-        self._log_step(pipeline, 1, total, "Business analysis")
-        try:
+        async def business_analysis() -> dict[str, Any]:
             analyzer = self._get_local_seo_analyzer()
-            analysis = await analyzer.analyze_business(url, business_name, location)
-            results["steps"]["business_analysis"] = {"status": "success", "data": analysis}
-            self._log_step(pipeline, 1, total, "Business analysis", "done")
-        except Exception as exc:
-            logger.exception("Business analysis failed: %s", exc)
-            results["steps"]["business_analysis"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 1, total, "Business analysis", "error")
+            return {"data": await self._bounded(lambda: analyzer.analyze_business(url, business_name, location))}
 
-        # Step 2: Citation checking
-        self._log_step(pipeline, 2, total, "Citation checking")
-        try:
-            from src.modules.local_seo import CitationChecker
-            citation_checker = CitationChecker()
-            citations = await citation_checker.check_all_citations(business_name, location)
+        async def citation_check() -> dict[str, Any]:
+            citation_checker = self._get_citation_checker()
+            citations = await self._bounded(lambda: citation_checker.check_all_citations(business_name, location))
             citation_summary = citation_checker.generate_citation_summary(citations)
-            results["steps"]["citation_check"] = {"status": "success", "citations": citations, "summary": citation_summary}
-            self._log_step(pipeline, 2, total, "Citation checking", "done")
-        except Exception as exc:
-            logger.exception("Citation checking failed: %s", exc)
-            results["steps"]["citation_check"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 2, total, "Citation checking", "error")
-
-        # Step 3: GBP/GMB analysis
-        self._log_step(pipeline, 3, total, "GBP analysis")
-        try:
-            from src.modules.local_seo import GMBAnalyzer
-            gmb = GMBAnalyzer()
+            return {"citations": citations, "summary": citation_summary}
+
+        async def gbp_analysis() -> dict[str, Any]:
+            # GMBAnalyzer lazily launches one browser and is not safe to share
+            # between concurrent calls, so each lookup gets its own instance
+            listing_gmb, map_pack_gmb = self._new("gmb_analyzer"), self._new("gmb_analyzer")
+            lookups = [
+                asyncio.ensure_future(self._bounded(
+                    lambda: listing_gmb.analyze_gbp_listing(business_name, location))),
+                asyncio.ensure_future(self._bounded(
+                    lambda: map_pack_gmb.get_map_pack_results(business_name, location))),
+            ]
             try:
-                gbp_data = await gmb.analyze_gbp_listing(business_name, location)
-                map_pack = await gmb.get_map_pack_results(business_name, location)
-                results["steps"]["gbp_analysis"] = {"status": "success", "gbp": gbp_data, "map_pack": map_pack}
+                gbp_data, map_pack = await asyncio.gather(*lookups)
             finally:
-                await gmb.close()
-            self._log_step(pipeline, 3, total, "GBP analysis", "done")
-        except Exception as exc:
-            logger.exception("GBP analysis failed: %s", exc)
-            results["steps"]["gbp_analysis"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 3, total, "GBP analysis", "error")
-
-        # Step 4: Local keyword tracking
-        self._log_step(pipeline, 4, total, "Local keyword tracking")
-        try:
+                # gather does not stop the other lookup when one fails; it
+                # must be finished before its browser is closed under it
+                for lookup in lookups:
+                    lookup.cancel()
+                await asyncio.gather(*lookups, return_exceptions=True)
+                await asyncio.gather(listing_gmb.close(), map_pack_gmb.close())
+            return {"gbp": gbp_data, "map_pack": map_pack}
+
+        async def local_ranking() -> dict[str, Any]:
             tracker = self._get_rank_tracker()
-            local_keywords = [
-                f"{business_name} {location}",
-                f"{business_name} near me",
-                f"best {business_name} {location}",
-            ]
-            rank_results = await tracker.track_keywords_bulk(domain, local_keywords)
-            results["steps"]["local_ranking"] = {"status": "success", "data": rank_results}
-            self._log_step(pipeline, 4, total, "Local keyword tracking", "done")
-        except Exception as exc:
-            logger.exception("Local keyword tracking failed: %s", exc)
-            results["steps"]["local_ranking"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 4, total, "Local keyword tracking", "error")
+            return {"data": await self._bounded(lambda: tracker.track_keywords_bulk(domain, local_keywords))}
 
-        # Step 5: Competitor analysis
-        self._log_step(pipeline, 5, total, "Local competitor analysis")
-        try:
+        async def competitor_analysis() -> dict[str, Any]:
             topical = self._get_topical_researcher()
-            comp_data = await topical.analyze_competitors(business_name, location)
-            results["steps"]["competitor_analysis"] = {"status": "success", "data": comp_data}
-            self._log_step(pipeline, 5, total, "Local competitor analysis", "done")
-        except Exception as exc:
-            logger.exception("Local competitor analysis failed: %s", exc)
-            results["steps"]["competitor_analysis"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 5, total, "Local competitor analysis", "error")
+            return {"data": await self._bounded(lambda: topical.analyze_competitors(business_name, location))}
 
-        # Step 6: Local SEO report
-        self._log_step(pipeline, 6, total, "Local SEO report")
-        try:
+        async def local_report() -> dict[str, Any]:
             report_gen = self._get_local_report_generator()
-            audit_data = results["steps"].get("business_analysis", {}).get("data", {})
-            if audit_data:
-                html_report = report_gen.generate_html_report(audit_data)
-                report_path = report_gen.save_report(html_report, f"local_seo_{domain.replace('.', '_')}")
-                results["steps"]["local_report"] = {"status": "success", "report_path": report_path}
-            else:
-                results["steps"]["local_report"] = {"status": "skipped", "reason": "No analysis data available"}
-            self._log_step(pipeline, 6, total, "Local SEO report", "done")
-        except Exception as exc:
-            logger.exception("Local SEO report failed: %s", exc)
-            results["steps"]["local_report"] = {"status": "error", "error": str(exc)}
-            self._log_step(pipeline, 6, total, "Local SEO report", "error")
-
-        elapsed = time.time() - started
-        results["elapsed_seconds"] = round(elapsed, 2)
-        results["completed_at"] = datetime.utcnow().isoformat()
-        step_statuses = [v.get("status", "unknown") for v in results["steps"].values()]
-        success_count = step_statuses.count("success")
-        total_count = len(step_statuses)
-        results["summary"] = f"{success_count}/{total_count} steps succeeded in {elapsed:.1f}s"
-        logger.info("Local SEO pipeline completed: %s", results["summary"])
-        return results
+            audit_data = steps["business_analysis"].get("data")
+            if not audit_data:
+                return {"status": "skipped", "reason": "No analysis data available"}
+            # Rendering and the file write are synchronous; keep them off the loop
+            html_report = await asyncio.to_thread(report_gen.generate_html_report, audit_data)
+            report_path = await asyncio.to_thread(
+                report_gen.save_report, html_report, f"local_seo_{domain_slug}")
+            return {"report_path": report_path}
+
+        # Steps 1-5 only need the inputs; the report renders the business analysis
+        await self._run_dag((
+            _Step("business_analysis", 1, "Business analysis", business_analysis),
+            _Step("citation_check", 2, "Citation checking", citation_check),
+            _Step(
+                "gbp_analysis", 3, "GBP analysis", gbp_analysis,
+                timeout=self._BROWSER_STEP_TIMEOUT,
+            ),
+            _Step("local_ranking", 4, "Local keyword tracking", local_ranking),
+            _Step("competitor_analysis", 5, "Local competitor analysis", competitor_analysis),
+            _Step("local_report", 6, "Local SEO report", local_report, ("business_analysis",)),
+        ), steps)
+
+        return await self._finish(results, started, "Local SEO")
@@ -13,6 +13,30 @@ if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
 
+@pytest.fixture(scope="session")
+def settings_yaml_path():
+    """Return the path of config/settings.yaml."""
+    return Path(_project_root) / "config" / "settings.yaml"
+
+
+@pytest.fixture(scope="session")
+def settings_config(settings_yaml_path):
+    """Return config/settings.yaml parsed once for the whole test session."""
+    import yaml
+    # libyaml's C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # One read of the whole file; the loader then works on a single buffer
+    return yaml.load(settings_yaml_path.read_bytes(), Loader=loader)
+
+
+@pytest.fixture(scope="session")
+def cli_runner_app():
+    """Return ``(CliRunner(), app)`` with the CLI imported once per session."""
+    from typer.testing import CliRunner
+    from src.cli import app
+    return CliRunner(), app
+
+
 @pytest.fixture(autouse=True)
 def _reset_db_engine():
     """Autouse fixture: reset the global DB engine before and after every test.
@@ -6,8 +6,9 @@ configuration loading, CLI smoke tests, and syntax validation of
 every Python file in the project.
 """
 
-import ast
+import functools
 import importlib
+import importlib.util
 import os
 import sys
 from pathlib import Path
@@ -15,10 +16,54 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.utils.text_processing import (
+    calculate_keyword_density,
+    calculate_readability,
+    count_words,
+    extract_headings,
+)
+
 # ---------------------------------------------------------------------------
 # Project root (conftest.py already puts it on sys.path)
 # ---------------------------------------------------------------------------
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DASHBOARD_APP_PATH = PROJECT_ROOT / "dashboard" / "app.py"
+DASHBOARD_PAGES_DIR = PROJECT_ROOT / "dashboard" / "pages"
+CLI_COMMANDS = (
+    "audit",
+    "keywords",
+    "content",
+    "links",
+    "track",
+    "local",
+    "monitor",
+    "full",
+    "report",
+    "news",
+    "dashboard",
+    "setup",
+    "status",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_or_error(path_str, mtime, size):
+    """Compile the file; None if it compiles, else the error message.
+
+    Keyed by mtime and size as well, so the dashboard and whole-tree
+    syntax tests share one parse per unchanged file.
+    """
+    try:
+        compile(Path(path_str).read_bytes(), path_str, "exec", dont_inherit=True)
+    except Exception as exc:
+        return str(exc)
+    return None
+
+
+def _syntax_error(path):
+    """Return the cached parse error for *path*, or None."""
+    st = path.stat()
+    return _parse_or_error(str(path), st.st_mtime, st.st_size)
 
 
 # ===========================================================================
@@ -194,6 +239,24 @@ class TestWorkflowEngine:
         engine = WorkflowEngine()
         assert engine is not None
 
+    def test_instance_is_shared(self):
+        from src.workflows import WorkflowEngine
+        assert WorkflowEngine.instance() is WorkflowEngine.instance()
+        assert WorkflowEngine.instance() is not WorkflowEngine()
+
+    def test_instance_evicts_least_recently_used(self, monkeypatch):
+        from src.workflows import WorkflowEngine
+        monkeypatch.setattr(WorkflowEngine, "_SHARED_MAX", 2)
+        monkeypatch.setattr(WorkflowEngine, "_shared", type(WorkflowEngine._shared)())
+        first = WorkflowEngine.instance("a")
+        first._instances["llm_client"] = client = object()
+        WorkflowEngine.instance("b")
+        WorkflowEngine.instance("c")
+        assert list(WorkflowEngine._shared) == ["b", "c"]
+        # Dropped from the cache but left open for whoever still holds it
+        assert first._instances == {"llm_client": client}
+        assert WorkflowEngine.instance("a") is not first
+
     def test_get_pipeline_status_empty(self):
         from src.workflows import WorkflowEngine
         engine = WorkflowEngine()
@@ -223,6 +286,7 @@ class TestWorkflowEngine:
             "_get_serp_analyzer",
             "_get_local_seo_analyzer",
             "_get_local_report_generator",
+            "_get_citation_checker",
             "_get_report_engine",
             "_get_report_renderer",
             "_get_seo_news_scraper",
@@ -239,6 +303,7 @@ class TestWorkflowEngine:
         engine = WorkflowEngine()
         pipeline_methods = [
             "run_full_seo_pipeline",
+            "stream_full_seo_pipeline",
             "run_content_pipeline",
             "run_link_building_pipeline",
             "run_monitoring_pipeline",
@@ -250,6 +315,197 @@ class TestWorkflowEngine:
             )
             assert callable(getattr(engine, method_name))
 
+    def test_run_step_isolates_failures(self):
+        """A failing step is recorded as an error instead of raising."""
+        import asyncio
+        from src.workflows import WorkflowEngine, _pipeline_ctx
+        engine = WorkflowEngine()
+
+        async def ok():
+            return {"data": 1}
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        async def run():
+            _pipeline_ctx.set(("p", 2))
+            return await asyncio.gather(
+                engine._run_step(1, "Good step", ok),
+                engine._run_step(2, "Bad step", boom),
+            )
+
+        good, bad = asyncio.run(run())
+        assert good == {"status": "success", "data": 1}
+        assert bad == {"status": "error", "error": "boom"}
+        assert "elapsed_ms" in engine.get_pipeline_status()["p"]
+
+    def test_run_step_times_out(self):
+        """A step outliving its timeout is cancelled and recorded as such."""
+        import asyncio
+        from src.workflows import WorkflowEngine, _pipeline_ctx
+        engine = WorkflowEngine()
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        async def run():
+            _pipeline_ctx.set(("p", 1))
+            return await engine._run_step(1, "Hanging step", hang, timeout=0.01)
+
+        assert asyncio.run(run())["status"] == "timeout"
+        assert engine.get_pipeline_status()["p"]["status"] == "timeout"
+
+    def test_step_sink_receives_each_step(self):
+        """Finished steps reach the step sink before _finish returns."""
+        import asyncio
+        import time
+        from src.workflows import WorkflowEngine, _pipeline_ctx
+        stored = []
+        engine = WorkflowEngine(step_sink=lambda *args: stored.append(args))
+
+        async def audit():
+            return {"data": 1}
+
+        async def run():
+            _pipeline_ctx.set(("p", 1))
+            results = {"steps": {"audit": await engine._run_step(1, "Audit", audit)}}
+            return await engine._finish(results, time.perf_counter(), "Test")
+
+        results = asyncio.run(run())
+        assert stored == [("p", "audit", {"status": "success", "data": 1})]
+        assert results["summary"].startswith("1/1 steps succeeded")
+
+    def test_finish_waits_only_for_its_own_pipeline(self):
+        """_finish does not block on step writes queued by another pipeline."""
+        import asyncio
+        import threading
+        import time
+        from src.workflows import WorkflowEngine, _pipeline_ctx
+        release = threading.Event()
+
+        def sink(pipeline, key, entry):
+            if pipeline == "slow":
+                release.wait(5)
+
+        engine = WorkflowEngine(step_sink=sink)
+
+        async def step():
+            return {"data": 1}
+
+        async def slow():
+            _pipeline_ctx.set(("slow", 1))
+            await engine._run_step(1, "Slow", step)
+
+        async def fast():
+            _pipeline_ctx.set(("fast", 1))
+            results = {"steps": {"step": await engine._run_step(1, "Fast", step)}}
+            return await engine._finish(results, time.perf_counter(), "Fast")
+
+        async def run():
+            await asyncio.create_task(slow())
+            results = await asyncio.wait_for(fast(), 2)
+            release.set()
+            return results
+
+        assert asyncio.run(run())["summary"].startswith("1/1 steps succeeded")
+
+    def test_bounded_caps_concurrency(self):
+        """_bounded never lets more than max_parallel calls run at once."""
+        import asyncio
+        from src.workflows import WorkflowEngine
+        engine = WorkflowEngine(max_parallel=2)
+        active = peak = 0
+
+        async def call():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+
+        async def run():
+            await asyncio.gather(*(engine._bounded(call) for _ in range(6)))
+
+        asyncio.run(run())
+        asyncio.run(run())  # a fresh event loop gets a fresh semaphore
+        assert peak == 2
+
+    def test_bounded_cancelled_while_queued_never_calls(self):
+        """A call cancelled while waiting for a slot is never created."""
+        import asyncio
+        from src.workflows import WorkflowEngine
+        engine = WorkflowEngine(max_parallel=1)
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+
+        async def run():
+            holder = asyncio.ensure_future(engine._bounded(call))
+            await asyncio.sleep(0)
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(engine._bounded(call), 0.01)
+            await holder
+
+        asyncio.run(run())
+        assert calls == [1]
+
+    def test_run_dag_respects_dependencies(self):
+        """_run_dag starts a step only after its deps and keeps step order."""
+        import asyncio
+        from src.workflows import WorkflowEngine, _Step, _pipeline_ctx
+        engine = WorkflowEngine()
+        steps = {}
+
+        def make(key):
+            async def run():
+                return {"seen": sorted(steps)}
+            return run
+
+        async def run():
+            _pipeline_ctx.set(("p", 3))
+            await engine._run_dag((
+                _Step("c", 3, "C", make("c"), ("a", "b")),
+                _Step("a", 1, "A", make("a")),
+                _Step("b", 2, "B", make("b")),
+            ), steps)
+
+        asyncio.run(run())
+        assert list(steps) == ["a", "b", "c"]
+        assert steps["a"]["seen"] == [] and steps["c"]["seen"] == ["a", "b"]
+
+        async def cyclic():
+            _pipeline_ctx.set(("p", 2))
+            await engine._run_dag((
+                _Step("x", 1, "X", make("x"), ("y",)),
+                _Step("y", 2, "Y", make("y"), ("x",)),
+            ), {})
+
+        with pytest.raises(ValueError):
+            asyncio.run(cyclic())
+
+    def test_cached_shares_inflight_and_stored_results(self):
+        """Concurrent and repeated _cached calls for one key run the factory once."""
+        import asyncio
+        from src.workflows import WorkflowEngine
+        engine = WorkflowEngine()
+        calls = []
+
+        async def lookup():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return {"map": "data"}
+
+        async def run():
+            first = await asyncio.gather(
+                *(engine._cached("map", "SEO ", lookup) for _ in range(3))
+            )
+            return first + [await engine._cached("map", "seo", lookup)]
+
+        assert asyncio.run(run()) == [{"map": "data"}] * 4
+        assert len(calls) == 1
+
 
 # ===========================================================================
 # 5. SchemaGenerator
@@ -313,13 +569,11 @@ class TestTextProcessing:
     """Text utility functions should work correctly."""
 
     def test_count_words(self):
-        from src.utils.text_processing import count_words
         assert count_words("one two three") == 3
         assert count_words("") == 0
         assert count_words("single") == 1
 
     def test_calculate_readability(self):
-        from src.utils.text_processing import calculate_readability
         text = (
             "The quick brown fox jumps over the lazy dog. "
             "This is a simple sentence for readability testing. "
@@ -330,7 +584,6 @@ class TestTextProcessing:
         assert "flesch_reading_ease" in result
 
     def test_calculate_keyword_density(self):
-        from src.utils.text_processing import calculate_keyword_density
         text = "seo tools are the best seo tools for modern seo optimization"
         result = calculate_keyword_density(text, "seo")
         assert isinstance(result, dict)
@@ -340,7 +593,6 @@ class TestTextProcessing:
         assert result["total_words"] > 0
 
     def test_extract_headings(self):
-        from src.utils.text_processing import extract_headings
         html = "<h1>Main Title</h1><p>Text</p><h2>Subtitle</h2>"
         headings = extract_headings(html)
         assert isinstance(headings, list)
@@ -357,41 +609,91 @@ class TestReportWidgets:
     test environments. Tests are skipped when plotly is unavailable.
     """
 
-    @pytest.fixture(autouse=True)
-    def _skip_without_plotly(self):
-        pytest.importorskip("plotly", reason="plotly required for ReportWidgets")
+    pytestmark = pytest.mark.skipif(
+        importlib.util.find_spec("plotly") is None,
+        reason="plotly required for ReportWidgets",
+    )
 
-    def _get_widgets_class(self):
+    @pytest.fixture(scope="class")
+    def widgets_cls(self):
         from src.modules.reporting import ReportWidgets
         return ReportWidgets
 
-    def test_widgets_class_exists(self):
-        widgets = self._get_widgets_class()
-        assert widgets is not None
-
-    def test_score_gauge_callable(self):
-        widgets = self._get_widgets_class()
-        assert callable(getattr(widgets, "score_gauge", None))
+    def test_widgets_class_exists(self, widgets_cls):
+        assert widgets_cls is not None
 
-    def test_metric_card_callable(self):
-        widgets = self._get_widgets_class()
-        assert callable(getattr(widgets, "metric_card", None))
-
-    def test_module_score_grid_callable(self):
-        widgets = self._get_widgets_class()
-        assert callable(getattr(widgets, "module_score_grid", None))
-
-    def test_trend_chart_callable(self):
-        widgets = self._get_widgets_class()
-        assert callable(getattr(widgets, "trend_chart", None))
+    @pytest.mark.parametrize("name", [
+        "score_gauge",
+        "metric_card",
+        "module_score_grid",
+        "trend_chart",
+        "issues_summary_bar",
+        "action_items_table",
+    ])
+    def test_widget_callable(self, widgets_cls, name):
+        assert callable(getattr(widgets_cls, name, None))
 
-    def test_issues_summary_bar_callable(self):
-        widgets = self._get_widgets_class()
-        assert callable(getattr(widgets, "issues_summary_bar", None))
 
-    def test_action_items_table_callable(self):
-        widgets = self._get_widgets_class()
-        assert callable(getattr(widgets, "action_items_table", None))
+# ===========================================================================
+# 7b. PDF report builder (HTML assembly only; no PDF backend needed)
+# ===========================================================================
+class TestPDFReportBuilder:
+    """PDFReportBuilder should assemble a well-formed HTML document."""
+
+    def _make_builder(self):
+        from src.utils.pdf_report_builder import PDFReportBuilder
+        builder = PDFReportBuilder("Audit <Report>", "Sub", "Acme")
+        builder.add_cover_page("example.com", "2025-01-01", "Summary")
+        builder.add_executive_summary(["First & second"])
+        builder.add_table(["Page", "Score"], [["/a", 90], ["/b", None]])
+        return builder
+
+    def test_toc_follows_cover_page(self):
+        html = self._make_builder().build_html()
+        cover = html.index('class="cover-page"')
+        toc = html.index('class="toc"')
+        summary = html.index("<h1>Executive Summary</h1>")
+        assert cover < toc < summary
+
+    def test_text_is_escaped(self):
+        html = self._make_builder().build_html()
+        assert "Audit &lt;Report&gt;" in html
+        assert "First &amp; second" in html
+        assert "<td>N/A</td>" in html
+
+    def test_unused_css_rules_pruned(self):
+        html = self._make_builder().build_html()
+        css = html[html.index("<style>"):html.index("</style>")]
+        assert ".cover-page {" in css
+        assert ".warning-box {" not in css
+
+    def test_logo_is_embedded(self, tmp_path, monkeypatch):
+        from src.utils.pdf_report_builder import PDFReportBuilder
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+        monkeypatch.chdir(tmp_path)
+        builder = PDFReportBuilder("t", logo_path="logo.png")
+        html = builder.add_cover_page("example.com", "2025-01-01", "s").build_html()
+        # A relative src would resolve against wherever the renderer loads from
+        assert 'src="data:image/png;base64,' in html
+
+    def test_gauge_applies_thresholds(self):
+        import base64
+        from src.utils.pdf_report_builder import _COLORS, PDFReportBuilder
+
+        def gauge_svg(**kwargs):
+            html = PDFReportBuilder("t").add_gauge_chart(70, **kwargs).build_html()
+            b64 = html.split("data:image/svg+xml;base64,", 1)[1].split('"', 1)[0]
+            return base64.b64decode(b64).decode("utf-8")
+
+        assert _COLORS["yellow"] in gauge_svg()
+        assert _COLORS["green"] in gauge_svg(thresholds=(40, 65))
+        assert _COLORS["red"] in gauge_svg(thresholds=(75, 90))
+
+    def test_state_key_tracks_content(self):
+        first, second = self._make_builder(), self._make_builder()
+        assert first._state_key() == second._state_key()
+        second.add_paragraph("extra")
+        assert first._state_key() != second._state_key()
 
 
 # ===========================================================================
@@ -400,33 +702,20 @@ class TestReportWidgets:
 class TestSettingsYaml:
     """Configuration file should be loadable."""
 
-    def test_settings_file_exists(self):
-        settings_path = PROJECT_ROOT / "config" / "settings.yaml"
-        assert settings_path.exists(), "config/settings.yaml not found"
-
-    def test_settings_parseable(self):
-        import yaml
-        settings_path = PROJECT_ROOT / "config" / "settings.yaml"
-        with open(settings_path) as fh:
-            config = yaml.safe_load(fh)
-        assert isinstance(config, dict)
-
-    def test_settings_has_required_sections(self):
-        import yaml
-        settings_path = PROJECT_ROOT / "config" / "settings.yaml"
-        with open(settings_path) as fh:
-            config = yaml.safe_load(fh)
+    def test_settings_file_exists(self, settings_yaml_path):
+        assert settings_yaml_path.exists(), "config/settings.yaml not found"
+
+    def test_settings_parseable(self, settings_config):
+        assert isinstance(settings_config, dict)
+
+    def test_settings_has_required_sections(self, settings_config):
         for section in ("app", "database", "llm"):
-            assert section in config, (
+            assert section in settings_config, (
                 "Missing config section: " + section
             )
 
-    def test_settings_app_name(self):
-        import yaml
-        settings_path = PROJECT_ROOT / "config" / "settings.yaml"
-        with open(settings_path) as fh:
-            config = yaml.safe_load(fh)
-        assert config["app"]["name"] == "Full SEO Automation"
+    def test_settings_app_name(self, settings_config):
+        assert settings_config["app"]["name"] == "Full SEO Automation"
 
 
 # ===========================================================================
@@ -435,34 +724,15 @@ class TestSettingsYaml:
 class TestCLICommands:
     """CLI help should work for all registered commands."""
 
-    def _get_runner_and_app(self):
-        from typer.testing import CliRunner
-        from src.cli import app
-        return CliRunner(), app
-
-    def test_main_help(self):
-        runner, cli_app = self._get_runner_and_app()
+    def test_main_help(self, cli_runner_app):
+        runner, cli_app = cli_runner_app
         result = runner.invoke(cli_app, ["--help"])
         assert result.exit_code == 0
         assert "Full SEO Automation" in result.output
 
-    @pytest.mark.parametrize("command", [
-        "audit",
-        "keywords",
-        "content",
-        "links",
-        "track",
-        "local",
-        "monitor",
-        "full",
-        "report",
-        "news",
-        "dashboard",
-        "setup",
-        "status",
-    ])
-    def test_command_help(self, command):
-        runner, cli_app = self._get_runner_and_app()
+    @pytest.mark.parametrize("command", CLI_COMMANDS)
+    def test_command_help(self, cli_runner_app, command):
+        runner, cli_app = cli_runner_app
         result = runner.invoke(cli_app, [command, "--help"])
         assert result.exit_code == 0, (
             "Command '" + command + "' --help failed with exit code "
@@ -476,33 +746,27 @@ class TestCLICommands:
 class TestDashboardPagesSyntax:
     """Every dashboard page file should pass ast.parse."""
 
-    def _get_dashboard_pages(self):
-        pages_dir = PROJECT_ROOT / "dashboard" / "pages"
-        if not pages_dir.exists():
+    @pytest.fixture(scope="class")
+    def dashboard_pages(self):
+        if not DASHBOARD_PAGES_DIR.exists():
             return []
-        return sorted(pages_dir.glob("*.py"))
+        return sorted(DASHBOARD_PAGES_DIR.glob("*.py"))
 
     def test_dashboard_app_syntax(self):
-        app_path = PROJECT_ROOT / "dashboard" / "app.py"
-        if app_path.exists():
-            source = app_path.read_text(encoding="utf-8")
-            try:
-                ast.parse(source)
-            except SyntaxError as exc:
+        if DASHBOARD_APP_PATH.exists():
+            error = _syntax_error(DASHBOARD_APP_PATH)
+            if error:
                 pytest.fail(
-                    "dashboard/app.py has syntax error: " + str(exc)
+                    "dashboard/app.py has syntax error: " + error
                 )
 
-    def test_all_dashboard_pages_syntax(self):
-        pages = self._get_dashboard_pages()
-        assert len(pages) > 0, "No dashboard page files found"
+    def test_all_dashboard_pages_syntax(self, dashboard_pages):
+        assert len(dashboard_pages) > 0, "No dashboard page files found"
         errors = []
-        for page_path in pages:
-            source = page_path.read_text(encoding="utf-8")
-            try:
-                ast.parse(source)
-            except SyntaxError as exc:
-                errors.append(page_path.name + ": " + str(exc))
+        for page_path in dashboard_pages:
+            error = _syntax_error(page_path)
+            if error:
+                errors.append(page_path.name + ": " + error)
         if errors:
             pytest.fail(
                 "Dashboard page syntax errors:\n" + "\n".join(errors)
@@ -533,15 +797,9 @@ class TestAllPythonFilesSyntax:
         assert len(py_files) > 0, "No Python files found"
         errors = []
         for py_file in py_files:
-            try:
-                source = py_file.read_text(encoding="utf-8")
-                ast.parse(source)
-            except SyntaxError as exc:
-                rel = py_file.relative_to(PROJECT_ROOT)
-                errors.append(str(rel) + ": " + str(exc))
-            except Exception as exc:
-                rel = py_file.relative_to(PROJECT_ROOT)
-                errors.append(str(rel) + ": " + str(exc))
+            error = _syntax_error(py_file)
+            if error:
+                errors.append(str(py_file.relative_to(PROJECT_ROOT)) + ": " + error)
         if errors:
             msg = "Python syntax errors found in " + str(len(errors)) + " files:\n"
             msg += "\n".join(errors[:20])
@@ -554,21 +812,24 @@ class TestAllPythonFilesSyntax:
 class TestRequirementsInstallable:
     """Key packages from requirements.txt should be importable."""
 
-    @pytest.mark.parametrize("package", [
-        "typer",
-        "rich",
-        "sqlalchemy",
-        "yaml",  # PyYAML
-        "aiohttp",
-        "bs4",   # beautifulsoup4
-        "openai",
-        "feedparser",
-    ])
-    def test_package_importable(self, package):
-        try:
-            importlib.import_module(package)
-        except ImportError:
-            pytest.skip("Package not installed: " + package)
+    def test_packages_importable(self):
+        missing = []
+        for package in (
+            "typer",
+            "rich",
+            "sqlalchemy",
+            "yaml",  # PyYAML
+            "aiohttp",
+            "bs4",   # beautifulsoup4
+            "openai",
+            "feedparser",
+        ):
+            try:
+                importlib.import_module(package)
+            except ImportError:
+                missing.append(package)
+        if missing:
+            pytest.skip("Packages not installed: " + ", ".join(missing))
 
     def test_playwright_importable(self):
         try: